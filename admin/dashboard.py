@@ -12,18 +12,22 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
-import hashlib
 
 # 로깅 설정
 from utils.logger import setup_logger
 logger = setup_logger(name="admin_dashboard", log_to_file=True)
 
+# 비밀번호 검증
+from utils.security import verify_password
+
 # 익명 분석 시스템
 from utils.analytics import get_analytics
+from config import AnalyticsConfig
 analytics = get_analytics()
 
 # 페이지 설정
@@ -33,10 +37,54 @@ st.set_page_config(
     layout="wide"
 )
 
-
-def hash_password(password: str) -> str:
-    """비밀번호 해시 생성 (SHA-256)"""
-    return hashlib.sha256(password.encode()).hexdigest()
+# 표시용 컬럼 이름 및 형식 (렌더링마다 다시 만들지 않도록 모듈 수준에 정의)
+_DAILY_RENAME = {
+    'date': '날짜',
+    'total_sessions': '세션 수',
+    'pdf_analyses': 'PDF 분석',
+    'text_analyses': '텍스트 분석',
+    'successful': '성공',
+    'failed': '실패',
+    'total_file_size_mb': '파일 크기 (MB)'
+}
+_DAILY_COLUMN_CONFIG = {
+    '날짜': st.column_config.DateColumn(format="YYYY-MM-DD"),
+    '파일 크기 (MB)': st.column_config.NumberColumn(format="%.2f")
+}
+
+_RECENT_COLS = [
+    'timestamp', '상태', 'action_type', 'action_detail',
+    'file_size_mb', 'error_type'
+]
+_RECENT_RENAME = {
+    'timestamp': '시간',
+    'action_type': '활동 유형',
+    'action_detail': '상세 정보',
+    'file_size_mb': '파일 크기 (MB)',
+    'error_type': '에러 타입'
+}
+_RECENT_COLUMN_CONFIG = {
+    '시간': st.column_config.DatetimeColumn(format="YYYY-MM-DD HH:mm:ss"),
+    '파일 크기 (MB)': st.column_config.NumberColumn(format="%.2f")
+}
+
+
+@st.cache_data(ttl=AnalyticsConfig.DASHBOARD_CACHE_TTL, show_spinner=False)
+def _summary_stats() -> dict:
+    """요약 통계 조회 (캐시)"""
+    return analytics.get_summary_stats()
+
+
+@st.cache_data(ttl=AnalyticsConfig.DASHBOARD_CACHE_TTL, show_spinner=False)
+def _daily_stats(days: int) -> list:
+    """일일 통계 조회 (캐시)"""
+    return analytics.get_daily_stats(days=days)
+
+
+@st.cache_data(ttl=AnalyticsConfig.DASHBOARD_CACHE_TTL, show_spinner=False)
+def _recent_activities(limit: int) -> list:
+    """최근 활동 조회 (캐시)"""
+    return analytics.get_recent_activities(limit=limit)
 
 
 def check_authentication() -> bool:
@@ -64,10 +112,8 @@ def check_authentication() -> bool:
 
             비밀번호 해시 생성 방법:
             ```python
-            import hashlib
-            password = "your_password"
-            hash_value = hashlib.sha256(password.encode()).hexdigest()
-            print(hash_value)
+            from utils.security import hash_password
+            print(hash_password("your_password"))
             ```
             """)
             logger.warning("관리자 비밀번호가 설정되지 않음")
@@ -88,9 +134,7 @@ def check_authentication() -> bool:
 
         if submit:
             if password:
-                input_hash = hash_password(password)
-
-                if input_hash == admin_password_hash:
+                if verify_password(password, admin_password_hash):
                     st.session_state.admin_authenticated = True
                     logger.info("관리자 로그인 성공")
                     st.success("✅ 로그인 성공!")
@@ -129,7 +173,7 @@ def render_summary_stats():
     st.markdown("## 📈 전체 요약 통계")
 
     # 통계 가져오기
-    stats = analytics.get_summary_stats()
+    stats = _summary_stats()
 
     if not stats:
         st.warning("⚠️ 통계 데이터가 없습니다.")
@@ -180,6 +224,90 @@ def render_summary_stats():
         st.write(f"- 실패: **{stats.get('failed_analyses', 0)}**건")
 
 
+@st.cache_data(show_spinner=False)
+def _build_daily_figures(df: pd.DataFrame) -> tuple:
+    """일별 통계 차트 생성 (데이터가 같으면 캐시된 Figure 재사용)
+
+    Args:
+        df: 날짜순으로 정렬된 일일 통계 DataFrame
+
+    Returns:
+        (세션 & 분석 수, 성공/실패, 파일 크기) Figure 튜플
+    """
+    # 세션 및 분석 수 차트
+    sessions_fig = go.Figure()
+    sessions_fig.add_trace(go.Scatter(
+        x=df['date'],
+        y=df['total_sessions'],
+        mode='lines+markers',
+        name='세션 수',
+        line=dict(color='royalblue', width=2)
+    ))
+    sessions_fig.add_trace(go.Scatter(
+        x=df['date'],
+        y=df['pdf_analyses'],
+        mode='lines+markers',
+        name='PDF 분석',
+        line=dict(color='green', width=2)
+    ))
+    sessions_fig.add_trace(go.Scatter(
+        x=df['date'],
+        y=df['text_analyses'],
+        mode='lines+markers',
+        name='텍스트 분석',
+        line=dict(color='orange', width=2)
+    ))
+    sessions_fig.update_layout(
+        title="일별 세션 및 분석 수",
+        xaxis_title="날짜",
+        yaxis_title="개수",
+        hovermode='x unified',
+        height=400,
+        uirevision='daily'
+    )
+
+    # 성공/실패 차트
+    success_fig = go.Figure()
+    success_fig.add_trace(go.Bar(
+        x=df['date'],
+        y=df['successful'],
+        name='성공',
+        marker_color='lightgreen'
+    ))
+    success_fig.add_trace(go.Bar(
+        x=df['date'],
+        y=df['failed'],
+        name='실패',
+        marker_color='lightcoral'
+    ))
+    success_fig.update_layout(
+        title="일별 성공/실패 분석",
+        xaxis_title="날짜",
+        yaxis_title="개수",
+        barmode='stack',
+        hovermode='x unified',
+        height=400,
+        uirevision='daily'
+    )
+
+    # 파일 크기 차트
+    file_size_fig = px.line(
+        df,
+        x='date',
+        y='total_file_size_mb',
+        title='일별 총 파일 크기 (MB)',
+        markers=True
+    )
+    file_size_fig.update_layout(
+        xaxis_title="날짜",
+        yaxis_title="파일 크기 (MB)",
+        height=400,
+        uirevision='daily'
+    )
+
+    return sessions_fig, success_fig, file_size_fig
+
+
 def render_daily_chart():
     """일일 통계 차트 렌더링"""
     st.markdown("---")
@@ -187,7 +315,7 @@ def render_daily_chart():
 
     # 일일 통계 가져오기
     days = st.slider("조회 기간 (일)", min_value=7, max_value=90, value=30)
-    daily_stats = analytics.get_daily_stats(days=days)
+    daily_stats = _daily_stats(days)
 
     if not daily_stats:
         st.info("📭 데이터가 없습니다.")
@@ -195,110 +323,53 @@ def render_daily_chart():
 
     # DataFrame 생성
     df = pd.DataFrame(daily_stats)
-    df['date'] = pd.to_datetime(df['date'])
+    df['date'] = pd.to_datetime(df['date'], format='ISO8601', cache=True)
     df = df.sort_values('date')
 
     # 탭으로 차트 구분
     tab1, tab2, tab3 = st.tabs(["📈 세션 & 분석 수", "✅ 성공/실패", "💾 파일 크기"])
 
+    sessions_fig, success_fig, file_size_fig = _build_daily_figures(df)
+
     with tab1:
-        # 세션 및 분석 수 차트
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=df['date'],
-            y=df['total_sessions'],
-            mode='lines+markers',
-            name='세션 수',
-            line=dict(color='royalblue', width=2)
-        ))
-        fig.add_trace(go.Scatter(
-            x=df['date'],
-            y=df['pdf_analyses'],
-            mode='lines+markers',
-            name='PDF 분석',
-            line=dict(color='green', width=2)
-        ))
-        fig.add_trace(go.Scatter(
-            x=df['date'],
-            y=df['text_analyses'],
-            mode='lines+markers',
-            name='텍스트 분석',
-            line=dict(color='orange', width=2)
-        ))
-        fig.update_layout(
-            title="일별 세션 및 분석 수",
-            xaxis_title="날짜",
-            yaxis_title="개수",
-            hovermode='x unified',
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(sessions_fig, use_container_width=True, key="daily_sessions")
 
     with tab2:
-        # 성공/실패 차트
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=df['date'],
-            y=df['successful'],
-            name='성공',
-            marker_color='lightgreen'
-        ))
-        fig.add_trace(go.Bar(
-            x=df['date'],
-            y=df['failed'],
-            name='실패',
-            marker_color='lightcoral'
-        ))
-        fig.update_layout(
-            title="일별 성공/실패 분석",
-            xaxis_title="날짜",
-            yaxis_title="개수",
-            barmode='stack',
-            hovermode='x unified',
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(success_fig, use_container_width=True, key="daily_success")
 
     with tab3:
-        # 파일 크기 차트
-        fig = px.line(
-            df,
-            x='date',
-            y='total_file_size_mb',
-            title='일별 총 파일 크기 (MB)',
-            markers=True
-        )
-        fig.update_layout(
-            xaxis_title="날짜",
-            yaxis_title="파일 크기 (MB)",
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(file_size_fig, use_container_width=True, key="daily_file_size")
 
     # 데이터 테이블
     st.markdown("### 📋 상세 데이터")
     st.dataframe(
-        df.rename(columns={
-            'date': '날짜',
-            'total_sessions': '세션 수',
-            'pdf_analyses': 'PDF 분석',
-            'text_analyses': '텍스트 분석',
-            'successful': '성공',
-            'failed': '실패',
-            'total_file_size_mb': '파일 크기 (MB)'
-        }),
+        df.rename(columns=_DAILY_RENAME, copy=False),
         use_container_width=True,
-        hide_index=True
+        hide_index=True,
+        column_config=_DAILY_COLUMN_CONFIG
     )
 
 
+def _to_csv_bytes(df: pd.DataFrame, excel_bom: bool = True) -> bytes:
+    """DataFrame을 CSV 바이트로 변환
+
+    Args:
+        df: 변환할 DataFrame
+        excel_bom: 엑셀 한글 깨짐 방지를 위한 UTF-8 BOM 추가 여부
+
+    Returns:
+        CSV 바이트
+    """
+    return df.to_csv(index=False).encode('utf-8-sig' if excel_bom else 'utf-8')
+
+
 def render_recent_activities():
     """최근 활동 로그 렌더링"""
     st.markdown("---")
     st.markdown("## 📝 최근 활동 로그 (익명)")
 
     limit = st.number_input("표시할 활동 수", min_value=10, max_value=500, value=50)
-    activities = analytics.get_recent_activities(limit=limit)
+    activities = _recent_activities(limit)
 
     if not activities:
         st.info("📭 활동 데이터가 없습니다.")
@@ -306,35 +377,29 @@ def render_recent_activities():
 
     # DataFrame 생성
     df = pd.DataFrame(activities)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', cache=True, errors='coerce')
 
     # 성공/실패 아이콘 추가
-    df['상태'] = df['success'].apply(lambda x: "✅" if x else "❌")
+    df['상태'] = np.where(df['success'], "✅", "❌")
 
     # 표시할 컬럼 선택
-    display_df = df[[
-        'timestamp', '상태', 'action_type', 'action_detail',
-        'file_size_mb', 'error_type'
-    ]].rename(columns={
-        'timestamp': '시간',
-        'action_type': '활동 유형',
-        'action_detail': '상세 정보',
-        'file_size_mb': '파일 크기 (MB)',
-        'error_type': '에러 타입'
-    })
+    display_df = df[_RECENT_COLS].rename(
+        columns=_RECENT_RENAME,
+        copy=False
+    )
 
     # 데이터 테이블
     st.dataframe(
         display_df,
         use_container_width=True,
-        hide_index=True
+        hide_index=True,
+        column_config=_RECENT_COLUMN_CONFIG
     )
 
     # CSV 다운로드
-    csv = df.to_csv(index=False, encoding='utf-8-sig')
     st.download_button(
         label="📥 CSV 다운로드",
-        data=csv,
+        data=_to_csv_bytes(df),
         file_name=f"activity_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
         mime="text/csv"
     )
@@ -382,6 +447,7 @@ def main():
     col1, col2 = st.columns([6, 1])
     with col2:
         if st.button("🔄 새로고침"):
+            st.cache_data.clear()
             analytics.update_daily_stats()
             st.rerun()
 
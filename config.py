@@ -3,7 +3,8 @@ KOICA 사업 예비조사 심사 시스템 - 설정 파일
 모든 설정 상수와 기본값 관리
 """
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 
 class AppConfig:
@@ -29,6 +30,14 @@ class FileConfig:
     # 지원 파일 형식
     SUPPORTED_FILE_TYPES = ['pdf']
 
+    # PDF 텍스트 추출 엔진 ("pdfium": pypdfium2 사용, 미설치 시 PyPDF2 / "pypdf2": 항상 PyPDF2)
+    PDF_BACKEND = "pdfium"
+
+    # PDF 병렬 추출
+    PDF_PAGES_PER_TASK = 16  # 워커 하나가 처리할 페이지 수
+    PDF_MAX_WORKERS = None  # None이면 CPU 코어 수 사용
+    PDF_SPOOL_CHUNK_SIZE = 1 << 20  # 업로드 파일을 임시 파일로 복사할 때의 청크 크기 (1 MB)
+
 
 class RAGConfig:
     """RAG (Retrieval-Augmented Generation) 설정"""
@@ -40,12 +49,25 @@ class RAGConfig:
     # 벡터 검색
     TOP_K_DOCUMENTS = 15  # 검색할 상위 문서 수
     DEFAULT_K_SEARCH = 10  # 기본 검색 수
+    SEMANTIC_CACHE_THRESHOLD = 0.97  # 이전 쿼리 결과를 재사용할 최소 코사인 유사도
+
+    # 근사 최근접 이웃 (HNSW, hnswlib 설치 시에만 사용)
+    ANN_THRESHOLD = 5000  # 이 청크 수를 넘으면 HNSW 인덱스로 검색
+    ANN_M = 16
+    ANN_EF_CONSTRUCTION = 200
+    ANN_EF_SEARCH = 64
 
     # 임베딩
     EMBEDDING_MODEL = "models/text-embedding-004"
     EMBEDDING_DIMENSION = 768
     EMBEDDING_TASK_TYPE_DOC = "retrieval_document"
     EMBEDDING_TASK_TYPE_QUERY = "retrieval_query"
+    EMBEDDING_STORAGE_DTYPE = "float16"  # 벡터 스토어 보관 정밀도 (float16 / float32)
+    SCAN_BLOCK_ROWS = 256  # 전수 검색 시 float32로 변환해 한 번에 계산할 행 수 (L2 캐시 크기 기준)
+
+    # 검색 쿼리
+    POLICY_ALIGNMENT_QUERY = "국내외 정책 부합성, SDGs, 수원국 개발 정책, 한국 정부 CPS, 코이카 중기 전략, 타 공여기관 지원 현황, ODA"
+    IMPLEMENTATION_READINESS_QUERY = "사업 추진 여건, 수원국 추진체계, 국내 추진체계, 사업 추진전략, 리스크 관리, 성과관리, 예산, 일정"
 
     # 컨텍스트 길이
     MAX_CONTEXT_LENGTH = 35000  # API에 전송할 최대 컨텍스트 길이
@@ -54,13 +76,32 @@ class RAGConfig:
 class APIConfig:
     """API 설정"""
 
-    # 모델
-    GENERATIVE_MODEL = "gemini-2.5-pro"
+    # 모델 (기본은 빠르고 저렴한 Flash, 정확도가 필요하면 사이드바에서 Pro 선택)
+    GENERATIVE_MODEL = "gemini-2.5-flash"
+    HIGH_QUALITY_MODEL = "gemini-2.5-pro"
+    MODEL_TIERS: Dict[str, str] = {
+        "빠름 (Flash)": GENERATIVE_MODEL,
+        "정확 (Pro)": HIGH_QUALITY_MODEL,
+    }
+
+    # 임베딩 배치 (embed_content 한 번에 보낼 최대 텍스트 수)
+    EMBEDDING_BATCH_SIZE = 100
+    EMBEDDING_MAX_CONCURRENCY = 4  # 동시에 처리 중인 배치 요청 수 상한
+
+    # Rate Limiting (토큰 버킷)
+    EMBEDDING_REQUESTS_PER_MINUTE = 1500  # 임베딩 요청 할당량 (토큰 버킷 보충 속도)
+    EMBEDDING_REQUEST_BURST = 10  # 대기 없이 연속으로 보낼 수 있는 요청 수
+
+    # 컨텍스트 캐싱 (RAG 실패로 두 분석이 같은 본문을 공유할 때 본문을 한 번만 업로드)
+    ENABLE_CONTEXT_CACHE = True
+    CONTEXT_CACHE_TTL = 600  # 초
+    CONTEXT_CACHE_MIN_CHARS = 8000  # 모델의 최소 캐시 토큰 수를 넘기 위한 최소 본문 길이
+
+    # 분석 요청 타임아웃 (두 분석을 동시에 수행하므로 느린 쪽이 전체 시간을 결정)
+    GENERATION_TIMEOUT = 300  # 초
 
-    # Rate Limiting
-    RATE_LIMIT_DELAY = 0.3  # 일반 요청 간 대기 시간 (초)
-    RATE_LIMIT_BATCH_DELAY = 1.0  # 배치 요청 후 대기 시간 (초)
-    RATE_LIMIT_BATCH_SIZE = 10  # 배치 크기
+    # 배치 분석 (Gemini Batch API: 24시간 내 처리, 동기 호출 대비 50% 비용)
+    BATCH_MAX_DOCUMENTS = 50  # 한 번에 제출할 수 있는 최대 보고서 수
 
     # 재시도
     MAX_RETRIES = 3
@@ -75,29 +116,29 @@ class AuditConfig:
     IMPLEMENTATION_READINESS_MAX_SCORE = 70
     TOTAL_MAX_SCORE = 100
 
-    # 세부 평가 항목
-    AUDIT_CRITERIA: Dict[str, Dict[str, Any]] = {
-        "정책부합성": {
+    # 세부 평가 항목 (읽기 전용 공유 상수)
+    AUDIT_CRITERIA: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+        "정책부합성": MappingProxyType({
             "만점": 30,
-            "항목": [
-                {"name": "SDGs 연관성", "score": 10},
-                {"name": "수원국 정책", "score": 5},
-                {"name": "CPS/국정과제", "score": 5},
-                {"name": "코이카 전략", "score": 5},
-                {"name": "타 공여기관", "score": 5}
-            ]
-        },
-        "추진여건": {
+            "항목": (
+                MappingProxyType({"name": "SDGs 연관성", "score": 10}),
+                MappingProxyType({"name": "수원국 정책", "score": 5}),
+                MappingProxyType({"name": "CPS/국정과제", "score": 5}),
+                MappingProxyType({"name": "코이카 전략", "score": 5}),
+                MappingProxyType({"name": "타 공여기관", "score": 5})
+            )
+        }),
+        "추진여건": MappingProxyType({
             "만점": 70,
-            "항목": [
-                {"name": "수원국 추진체계", "score": 20},
-                {"name": "국내 추진체계", "score": 15},
-                {"name": "사업 추진전략", "score": 15},
-                {"name": "리스크 관리", "score": 10},
-                {"name": "성과관리", "score": 10}
-            ]
-        }
-    }
+            "항목": (
+                MappingProxyType({"name": "수원국 추진체계", "score": 20}),
+                MappingProxyType({"name": "국내 추진체계", "score": 15}),
+                MappingProxyType({"name": "사업 추진전략", "score": 15}),
+                MappingProxyType({"name": "리스크 관리", "score": 10}),
+                MappingProxyType({"name": "성과관리", "score": 10})
+            )
+        })
+    })
 
     # 점수 등급 기준
     SCORE_EXCELLENT_THRESHOLD = 80  # 우수
@@ -127,6 +168,9 @@ class UIConfig:
     PROGRESS_POLICY_ANALYSIS = "정책 부합성 분석 중..."
     PROGRESS_IMPL_ANALYSIS = "사업 추진 여건 분석 중..."
 
+    # 진행 바 갱신 간 최소 진행 비율 (5%, 작업 크기와 무관하게 최대 약 20회 갱신)
+    PROGRESS_UPDATE_STEP = 0.05
+
 
 class LogConfig:
     """로깅 설정"""
@@ -151,14 +195,32 @@ class CacheConfig:
     # 세션 상태 키
     SESSION_PDF_RESULTS = "pdf_results"
     SESSION_TEXT_RESULTS = "text_results"
-    SESSION_PDF_TEXT = "pdf_full_text"
     SESSION_VECTOR_STORE = "vector_store_cache"
     SESSION_DOC_HASH = "document_hash"
+    SESSION_BATCH_JOB = "batch_job"
 
     # 캐시 활성화
     ENABLE_EMBEDDING_CACHE = True
     ENABLE_RESULT_CACHE = True
 
+    # 캐시 크기
+    VECTOR_STORE_MAX_ENTRIES = 8  # 프로세스당 보관할 벡터 스토어 수
+    PDF_TEXT_MAX_ENTRIES = 8  # 프로세스당 보관할 PDF 추출 텍스트 수 (원본 파일 해시 기준)
+    RESULT_CACHE_MAX_ENTRIES = 64  # 프로세스당 보관할 심사 결과 수 (세션 간 공유)
+    RESULT_CACHE_TTL = 3600  # 심사 결과 캐시 유효 시간 (초)
+
+    # 공백만 다른 재업로드의 결과 재사용 (공백을 정규화한 텍스트의 해시가 같을 때만)
+    ENABLE_NORMALIZED_RESULT_CACHE = True
+    QUERY_EMBEDDING_MEMORY_SIZE = 128  # 메모리에 보관할 쿼리 임베딩 수
+    SEMANTIC_QUERY_CACHE_SIZE = 128  # 벡터 스토어별로 보관할 검색 결과 수
+
+    # 디스크 임베딩 캐시
+    EMBEDDING_CACHE_PATH = ".cache/embeddings.db"
+
+    # 디스크 벡터 스토어 (문서별 정규화 행렬을 .npy로 저장, 읽기 전용 mmap으로 로드)
+    ENABLE_VECTOR_STORE_PERSISTENCE = True
+    VECTOR_STORE_DIR = ".cache/vector_stores"
+
 
 class AnalyticsConfig:
     """익명 사용자 분석 설정 (개인정보 보호법 준수)"""
@@ -169,6 +231,17 @@ class AnalyticsConfig:
     # 분석 활성화
     ENABLE_ANALYTICS = True
 
+    # 백그라운드 기록 대기열 최대 길이 (가득 차면 새 기록은 버림)
+    LOG_QUEUE_MAX_SIZE = 1000
+
+    # 기록할 세션 비율 (0-1, 환경변수 ANALYTICS_SAMPLE_RATE로 변경 가능)
+    # 세션 단위로 표본을 뽑아 한 세션의 시작/성공/실패 기록은 함께 남거나 함께 빠짐
+    SAMPLE_RATE = 1.0
+    SAMPLE_RATE_ENV = "ANALYTICS_SAMPLE_RATE"
+
+    # 관리자 대시보드 조회 캐시 유지 시간 (초)
+    DASHBOARD_CACHE_TTL = 30
+
     # 수집하는 데이터 (익명)
     # - 익명 세션 ID (UUID)
     # - 타임스탬프
@@ -2,12 +2,14 @@
 KOICA 사업 예비조사 심사 시스템 - 핵심 모듈
 """
 
-from core.models import AuditEvidence
+from core.models import AuditEvidence, AnalysisResponse, ScoreItem
 from core.vector_store import SimpleVectorStore
 from core.auditor import KOICAAuditorStreamlit
 
 __all__ = [
     'AuditEvidence',
+    'AnalysisResponse',
+    'ScoreItem',
     'SimpleVectorStore',
     'KOICAAuditorStreamlit'
 ]
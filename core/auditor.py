@@ -3,24 +3,319 @@ KOICA 사업 예비조사 심사 시스템 - 심사 엔진
 AI 기반 사업 심사 로직 구현
 """
 
-import json
+import io
+import os
+import re
+import shutil
+import tempfile
+import hashlib
+import time
 import logging
+import threading
 import traceback
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple, Union
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import PyPDF2
 import google.generativeai as genai
 from google.generativeai.types import GenerationConfig
+from pydantic import ValidationError
 
-from core.models import AuditEvidence
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:  # PDFium이 없으면 PyPDF2로 추출
+    pdfium = None
+    PDFIUM_AVAILABLE = False
+
+from core.models import AuditEvidence, AnalysisResponse
 from core.vector_store import SimpleVectorStore
+from utils.progress import ThrottledProgress
 from config import (
-    RAGConfig, APIConfig, AuditConfig, UIConfig
+    RAGConfig, APIConfig, AuditConfig, UIConfig, FileConfig, CacheConfig
 )
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트 템플릿 ({context}에 보고서 발췌 내용 삽입)
+# 응답 JSON 구조는 response_schema(AnalysisResponse)로 강제되므로 프롬프트에는 항목 지침만 둡니다.
+# 고정된 역할/기준/지침을 앞에, 문서별로 달라지는 발췌 내용을 맨 끝에 두어
+# 매 요청의 프롬프트 앞부분이 동일하도록 합니다 (Gemini 암묵적 프롬프트 캐싱 대상).
+_POLICY_ALIGNMENT_PROMPT = """당신은 KOICA 사업 심사 전문가입니다. 다음 보고서 발췌 내용을 '국내외 정책 부합성' 기준으로 평가하세요.
+
+=== 평가 기준 (30점 만점) ===
+1. SDGs와의 연관성 (10점)
+2. 수원국 정책 부합성 (5점)
+3. 한국 정부 CPS 및 국정과제 연계 (5점)
+4. 코이카 중기전략 부합성 (5점)
+5. 타 공여기관 중복 분석 (5점)
+
+=== 출력 지침 ===
+- total_score: 0-30 사이 정수
+- detailed_scores: 아래 항목별로 item, score, max_score, reason(평가 근거)을 작성
+  SDGs (10점), 수원국 정책 (5점), CPS/국정과제 (5점), 코이카 전략 (5점), 타 공여기관 (5점)
+- reasoning: 점수 산정 논리 상세 설명
+- strengths, weaknesses, recommendations: 발견된 모든 강점/약점/개선안을 빠짐없이 나열
+
+=== 보고서 발췌 내용 ===
+{context}"""
+
+_IMPLEMENTATION_READINESS_PROMPT = """당신은 KOICA 사업 심사 전문가입니다. 다음 보고서 발췌 내용을 '사업 추진 여건' 기준으로 평가하세요.
+
+=== 평가 기준 (70점 만점) ===
+1. 수원국 추진체계 (20점)
+2. 국내 추진체계 (15점)
+3. 사업 추진전략 (15점)
+4. 리스크 관리 (10점)
+5. 성과관리 (10점)
+
+=== 출력 지침 ===
+- total_score: 0-70 사이 정수
+- detailed_scores: 아래 항목별로 item, score, max_score, reason(평가 근거)을 작성
+  수원국 추진체계 (20점), 국내 추진체계 (15점), 사업 추진전략 (15점), 리스크 관리 (10점), 성과관리 (10점)
+- reasoning: 점수 산정 논리 상세 설명
+- strengths, weaknesses, recommendations: 발견된 모든 강점/약점/개선안을 빠짐없이 나열
+
+=== 보고서 발췌 내용 ===
+{context}"""
+
+
+# 검색된 청크 사이 구분자
+_CHUNK_SEPARATOR = "\n---\n"
+
+# 컨텍스트 캐시 사용 시 {context} 자리에 들어가는 안내 문구
+_CACHED_CONTEXT_NOTE = "(보고서 본문은 함께 제공된 캐시 콘텐츠를 참조하세요)"
+
+
+def _specialize_prompt(template: str) -> Tuple[str, str]:
+    """프롬프트 템플릿을 {context} 앞뒤의 고정 문자열로 미리 분리
+
+    호출 시에는 문자열 연결만 하면 되므로 매번 템플릿을 해석하지 않습니다.
+
+    Args:
+        template: `{context}` 자리를 하나 포함한 format 템플릿
+
+    Returns:
+        (context 앞부분, context 뒷부분)
+    """
+    slot = "\x00context\x00"
+    prefix, _, suffix = template.format(context=slot).partition(slot)
+    return prefix, suffix
+
+
+_POLICY_ALIGNMENT_PREFIX, _POLICY_ALIGNMENT_SUFFIX = _specialize_prompt(_POLICY_ALIGNMENT_PROMPT)
+_IMPLEMENTATION_READINESS_PREFIX, _IMPLEMENTATION_READINESS_SUFFIX = _specialize_prompt(
+    _IMPLEMENTATION_READINESS_PROMPT
+)
+
+
+def _use_pdfium() -> bool:
+    """PDFium(pypdfium2) 추출 엔진 사용 여부"""
+    return PDFIUM_AVAILABLE and FileConfig.PDF_BACKEND == "pdfium"
+
+
+# PDF 원본: 바이트 또는 파일 경로 (경로면 워커마다 파일을 직접 열어 바이트 복사 전송 없음)
+PdfSource = Union[bytes, str]
+
+
+def _pypdf2_reader(source: PdfSource) -> PyPDF2.PdfReader:
+    """PyPDF2 리더 생성 (바이트는 BytesIO로 감쌈)"""
+    return PyPDF2.PdfReader(io.BytesIO(source) if isinstance(source, bytes) else source)
+
+
+def _count_pdf_pages(source: PdfSource) -> int:
+    """PDF 페이지 수 (PDFium이 열지 못하는 파일은 PyPDF2로 계산)"""
+    if _use_pdfium():
+        try:
+            pdf = pdfium.PdfDocument(source)
+        except pdfium.PdfiumError as e:
+            logger.warning(f"PDFium으로 열 수 없는 PDF, PyPDF2로 처리: {e}")
+        else:
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+    return len(_pypdf2_reader(source).pages)
+
+
+def _extract_page_range(source: PdfSource, start: int, end: int) -> Tuple[str, List[int]]:
+    """PDF 페이지 범위의 텍스트 추출 (프로세스 풀 워커)
+
+    Args:
+        source: PDF 원본 바이트 또는 파일 경로
+        start: 시작 페이지 인덱스 (포함)
+        end: 종료 페이지 인덱스 (제외)
+
+    Returns:
+        (추출된 텍스트, 실패한 페이지 번호 리스트)
+    """
+    if _use_pdfium():
+        try:
+            return _extract_page_range_pdfium(source, start, end)
+        except pdfium.PdfiumError:
+            pass  # PDFium이 열지 못하는 손상된 파일은 PyPDF2로 추출
+
+    reader = _pypdf2_reader(source)
+    texts = []
+    failed_pages = []
+
+    for i in range(start, end):
+        try:
+            texts.append(reader.pages[i].extract_text())
+        except Exception:
+            failed_pages.append(i + 1)
+
+    return "\n".join(texts), failed_pages
+
+
+def _extract_page_range_pdfium(source: PdfSource, start: int, end: int) -> Tuple[str, List[int]]:
+    """PDFium으로 PDF 페이지 범위의 텍스트 추출 (네이티브 코드, PyPDF2보다 빠름)"""
+    pdf = pdfium.PdfDocument(source)
+    texts = []
+    failed_pages = []
+
+    try:
+        for i in range(start, end):
+            page = textpage = None
+            try:
+                page = pdf[i]
+                textpage = page.get_textpage()
+                # PDFium은 줄바꿈을 CRLF로 반환하므로 PyPDF2 결과와 맞춤
+                texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+            except Exception:
+                failed_pages.append(i + 1)
+            finally:
+                # 페이지별 네이티브 메모리를 바로 해제 (실패한 페이지 포함)
+                for handle in (textpage, page):
+                    if handle is not None:
+                        handle.close()
+    finally:
+        pdf.close()
+
+    return "\n".join(texts), failed_pages
+
+
+# 프로세스 전역 심사 결과 캐시: (문서 해시, 모델, API 키 지문) → (저장 시각, 결과)
+# 재업로드나 다른 세션의 동일 문서는 Gemini 호출 없이 결과를 반환
+_result_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _get_cached_result(key: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+    """유효 시간 내의 캐시된 심사 결과 조회"""
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        if time.monotonic() - stored_at > CacheConfig.RESULT_CACHE_TTL:
+            del _result_cache[key]
+            return None
+        _result_cache.move_to_end(key)
+        return results
+
+
+def _put_cached_result(key: Tuple[str, str, str], results: Dict[str, Any]) -> None:
+    """심사 결과 저장 (가장 오래 사용되지 않은 항목부터 제거)"""
+    with _result_cache_lock:
+        _result_cache[key] = (time.monotonic(), results)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > CacheConfig.RESULT_CACHE_MAX_ENTRIES:
+            _result_cache.popitem(last=False)
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalized_hash(text: str, digest_size: int = 32) -> bytes:
+    """공백 차이를 무시한 텍스트 해시 (BLAKE2b)"""
+    return hashlib.blake2b(_WHITESPACE.sub(" ", text).strip().encode('utf-8'), digest_size=digest_size).digest()
+
+
+@st.cache_resource(max_entries=CacheConfig.PDF_TEXT_MAX_ENTRIES, show_spinner=False)
+def _extract_pdf_text(doc_hash: str, _pdf_file) -> str:
+    """원본 파일 해시 단위로 캐시되는 PDF 텍스트 추출
+
+    `_pdf_file`은 해시 대상에서 제외되며 캐시 미스일 때만 파싱합니다.
+    같은 파일로 다시 분석하면 PDF를 다시 읽지 않습니다.
+
+    Args:
+        doc_hash: PDF 원본 바이트 BLAKE2b 해시 (캐시 키)
+        _pdf_file: PDF 파일 객체 또는 파일 경로
+
+    Returns:
+        추출된 텍스트
+    """
+    logger.info(f"PDF 텍스트 캐시 미스: {doc_hash[:12]}...")
+    return KOICAAuditorStreamlit._read_pdf_text(_pdf_file)
+
+
+@st.cache_resource(max_entries=CacheConfig.VECTOR_STORE_MAX_ENTRIES, show_spinner=False)
+def _build_vector_store(
+    api_key: str,
+    doc_hash: str,
+    _chunks: Iterable[str],
+    total: int
+) -> SimpleVectorStore:
+    """문서 해시 단위로 캐시되는 벡터 스토어 생성
+
+    `_chunks`는 해시 대상에서 제외되며 캐시 미스일 때만 소비됩니다.
+    메모리 캐시 미스 시 디스크에 저장된 벡터 스토어를 먼저 찾습니다.
+
+    Args:
+        api_key: Gemini API 키
+        doc_hash: 문서 BLAKE2b 해시 (캐시 키)
+        _chunks: 임베딩할 청크
+        total: 전체 청크 수
+
+    Returns:
+        생성된 벡터 스토어
+    """
+    logger.info(f"벡터 스토어 캐시 미스: {doc_hash[:12]}...")
+
+    if not CacheConfig.ENABLE_VECTOR_STORE_PERSISTENCE:
+        return _new_vector_store(api_key, _chunks, total)
+
+    # 프로세스 재시작 후에도 디스크에 저장된 행렬을 mmap으로 재사용
+    store_path = _vector_store_path(doc_hash)
+    vector_store = SimpleVectorStore.load(api_key, store_path)
+    if vector_store is not None:
+        return vector_store
+
+    vector_store = _new_vector_store(api_key, _chunks, total)
+    # 임베딩 실패(제로 벡터)가 있으면 다음 실행에서 재시도하도록 저장하지 않음
+    if vector_store.get_stats()["zero_vectors"] == 0:
+        vector_store.save(store_path)
+    return vector_store
+
+
+def _vector_store_path(doc_hash: str) -> Path:
+    """문서 해시와 임베딩/청킹 설정으로 디스크 벡터 스토어 경로 생성
+
+    모델이나 청킹 설정이 바뀌면 경로도 바뀌어 이전 저장본은 사용되지 않습니다.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        doc_hash,
+        RAGConfig.EMBEDDING_MODEL,
+        str(RAGConfig.CHUNK_SIZE),
+        str(RAGConfig.CHUNK_OVERLAP)
+    ):
+        digest.update(part.encode('utf-8'))
+        digest.update(b"\0")
+    return Path(CacheConfig.VECTOR_STORE_DIR) / digest.hexdigest()
+
+
+def _new_vector_store(api_key: str, chunks: Iterable[str], total: int) -> SimpleVectorStore:
+    """벡터 스토어 생성 및 임베딩 (캐시 없음)"""
+    vector_store = SimpleVectorStore(api_key)
+    vector_store.add_texts(chunks, total=total)
+    return vector_store
+
 
 class KOICAAuditorStreamlit:
     """KOICA 심사 시스템 - RAG v3 (개선)
@@ -28,11 +323,12 @@ class KOICAAuditorStreamlit:
     Retrieval-Augmented Generation을 활용한 사업 심사 엔진
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, model_name: str = APIConfig.GENERATIVE_MODEL):
         """시스템 초기화
 
         Args:
             api_key: Gemini API 키
+            model_name: 분석 모델명 (기본 Flash, 고품질 분석은 Pro)
 
         Raises:
             ValueError: API 키가 없는 경우
@@ -44,29 +340,33 @@ class KOICAAuditorStreamlit:
         try:
             genai.configure(api_key=api_key)
 
-            # JSON 모드 설정
+            # 구조화 출력(JSON 스키마) 설정
             self.json_config = GenerationConfig(
-                response_mime_type="application/json"
+                response_mime_type="application/json",
+                response_schema=AnalysisResponse
             )
 
             # Gemini 모델 초기화
+            self.model_name = model_name
             self.model = genai.GenerativeModel(
-                APIConfig.GENERATIVE_MODEL,
+                model_name,
                 generation_config=self.json_config
             )
 
             self.api_key = api_key
-            logger.info("KOICAAuditorStreamlit 초기화 완료")
+            self._api_key_fingerprint = hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest()
+            logger.info(f"KOICAAuditorStreamlit 초기화 완료 (모델: {model_name})")
 
         except Exception as e:
             logger.error(f"Gemini API 연결 실패: {e}")
             raise Exception(f"Gemini API 연결 실패: {e}")
 
-    def extract_text_from_pdf(self, pdf_file) -> str:
+    def extract_text_from_pdf(self, pdf_file, doc_hash: Optional[str] = None) -> str:
         """PDF에서 전체 텍스트 추출
 
         Args:
-            pdf_file: PDF 파일 객체 (Streamlit UploadedFile)
+            pdf_file: PDF 파일 객체 (Streamlit UploadedFile) 또는 파일 경로
+            doc_hash: 원본 파일 해시 (있으면 같은 파일의 추출 결과를 재사용)
 
         Returns:
             추출된 텍스트
@@ -74,27 +374,70 @@ class KOICAAuditorStreamlit:
         Raises:
             Exception: PDF 처리 실패
         """
-        try:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            full_text = ""
-            total_pages = len(pdf_reader.pages)
+        if doc_hash is None:
+            return self._read_pdf_text(pdf_file)
+        return _extract_pdf_text(doc_hash, pdf_file)
 
-            logger.info(f"PDF 텍스트 추출 시작 (총 {total_pages} 페이지)")
-            progress_bar = st.progress(0, text="📄 PDF 텍스트 추출 중...")
+    @staticmethod
+    def _read_pdf_text(pdf_file) -> str:
+        """PDF 파일 객체 또는 경로에서 텍스트 추출 (캐시 없음)
+
+        파일 객체는 임시 파일로 복사한 뒤 경로로 처리합니다.
+        워커 프로세스에는 경로만 전달되어 PDF 바이트를 작업마다 복사하지 않습니다.
+        """
+        if isinstance(pdf_file, (str, os.PathLike)):
+            return KOICAAuditorStreamlit._read_pdf_path(os.fspath(pdf_file))
 
-            for page_num, page in enumerate(pdf_reader.pages, 1):
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+                tmp_path = tmp.name
+                pdf_file.seek(0)
+                shutil.copyfileobj(pdf_file, tmp, length=FileConfig.PDF_SPOOL_CHUNK_SIZE)
+            pdf_file.seek(0)
+            return KOICAAuditorStreamlit._read_pdf_path(tmp_path)
+
+        except OSError as e:
+            logger.error(f"PDF 임시 파일 저장 오류: {e}")
+            raise Exception(f"PDF 처리 오류: {e}")
+
+        finally:
+            if tmp_path is not None:
                 try:
-                    full_text += page.extract_text() + "\n"
-                    progress = page_num / total_pages
-                    progress_bar.progress(
-                        progress,
-                        text=f"페이지 추출 중: {page_num}/{total_pages}"
-                    )
-                except Exception as e:
-                    logger.warning(f"페이지 {page_num} 처리 오류: {e}")
-                    st.warning(f"페이지 {page_num} 처리 오류 (건너뜀)")
+                    os.unlink(tmp_path)
+                except OSError as e:
+                    logger.warning(f"PDF 임시 파일 삭제 실패: {e}")
+
+    @staticmethod
+    def _read_pdf_path(pdf_path: str) -> str:
+        """PDF 파싱 및 페이지 범위 병렬 텍스트 추출"""
+        try:
+            total_pages = _count_pdf_pages(pdf_path)
+
+            step = FileConfig.PDF_PAGES_PER_TASK
+            ranges = [(start, min(start + step, total_pages)) for start in range(0, total_pages, step)]
+
+            logger.info(f"PDF 텍스트 추출 시작 (총 {total_pages} 페이지, {len(ranges)}개 작업)")
+            progress_bar = ThrottledProgress(total_pages, text="📄 PDF 텍스트 추출 중...")
 
+            # 범위별 결과를 모은 뒤 한 번만 연결 (반복 += 재할당 방지)
+            parts: List[str] = []
+            failed: List[int] = []
+            results = KOICAAuditorStreamlit._iter_page_ranges(pdf_path, ranges)
+
+            for (_, end), (text, failed_pages) in zip(ranges, results):
+                parts.append(text)
+                failed.extend(failed_pages)
+                progress_bar.update(end, text=f"페이지 추출 중: {end}/{total_pages}")
+
+            full_text = "\n".join(parts)
             progress_bar.empty()
+
+            # 실패 페이지는 페이지마다 메시지를 보내지 않고 한 번에 표시
+            if failed:
+                pages = ", ".join(map(str, failed))
+                logger.warning(f"페이지 처리 오류: {pages}")
+                st.warning(f"{len(failed)}개 페이지 처리 오류 (건너뜀): {pages}")
             logger.info(f"PDF 텍스트 추출 완료 ({len(full_text)} 문자)")
             return full_text
 
@@ -102,11 +445,72 @@ class KOICAAuditorStreamlit:
             logger.error(f"PDF 처리 오류: {e}")
             raise Exception(f"PDF 처리 오류: {e}")
 
-    def create_vector_store(self, full_text: str) -> Optional[SimpleVectorStore]:
+    @staticmethod
+    def _iter_page_ranges(
+        source: PdfSource,
+        ranges: List[Tuple[int, int]]
+    ) -> Iterator[Tuple[str, List[int]]]:
+        """페이지 범위별 추출 결과를 순서대로 생성
+
+        범위가 하나뿐인 작은 문서는 프로세스 생성 비용을 피해 직접 처리합니다.
+
+        Args:
+            source: PDF 원본 바이트 또는 파일 경로
+            ranges: (시작, 종료) 페이지 범위 리스트
+
+        Yields:
+            (추출된 텍스트, 실패한 페이지 번호 리스트)
+        """
+        if len(ranges) <= 1:
+            for start, end in ranges:
+                yield _extract_page_range(source, start, end)
+            return
+
+        with ProcessPoolExecutor(max_workers=FileConfig.PDF_MAX_WORKERS) as executor:
+            yield from executor.map(
+                _extract_page_range,
+                [source] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges]
+            )
+
+    @staticmethod
+    def _hash_document(full_text: str) -> str:
+        """문서 내용 해시 (캐시 키, BLAKE2b)"""
+        return hashlib.blake2b(full_text.encode('utf-8'), digest_size=32).hexdigest()
+
+    @staticmethod
+    def hash_pdf_file(pdf_file) -> str:
+        """업로드된 PDF 원본 바이트 해시 (캐시 키, BLAKE2b)
+
+        텍스트를 추출하기 전에 파일 객체를 1 MB 블록 단위로 읽어 해시를 계산합니다.
+        (`hashlib.file_digest`는 Python 3.11 이상에서만 제공되므로 사용하지 않음)
+
+        Args:
+            pdf_file: PDF 파일 객체 (Streamlit UploadedFile)
+
+        Returns:
+            해시 문자열
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        pdf_file.seek(0)
+        for block in iter(lambda: pdf_file.read(FileConfig.PDF_SPOOL_CHUNK_SIZE), b""):
+            digest.update(block)
+        pdf_file.seek(0)
+        return digest.hexdigest()
+
+    def create_vector_store(
+        self,
+        full_text: str,
+        doc_hash: Optional[str] = None
+    ) -> Optional[SimpleVectorStore]:
         """텍스트를 청크로 나누고 벡터 스토어 생성
 
+        같은 문서는 해시로 캐시된 벡터 스토어를 재사용합니다.
+
         Args:
             full_text: 전체 텍스트
+            doc_hash: 문서 해시 (없으면 계산)
 
         Returns:
             생성된 벡터 스토어 또는 None
@@ -116,24 +520,34 @@ class KOICAAuditorStreamlit:
             st.error("추출된 텍스트가 없습니다.")
             return None
 
-        # 텍스트를 청크로 분할
-        chunks = self._split_text(
+        # 중복 청크를 제외한 시작 오프셋만 먼저 구해 실제 임베딩할 청크 수를 표시하고,
+        # 청크 문자열은 스트리밍으로 전달
+        starts = self._unique_chunk_starts(
             full_text,
             chunk_size=RAGConfig.CHUNK_SIZE,
             overlap=RAGConfig.CHUNK_OVERLAP
         )
+        chunk_count = len(starts)
 
-        if not chunks:
+        if not chunk_count:
             logger.error("텍스트를 청크로 나눌 수 없습니다")
             st.error("텍스트를 청크로 나눌 수 없습니다.")
             return None
 
-        st.info(f"📦 총 {len(chunks)}개 청크 생성됨")
-        logger.info(f"텍스트를 {len(chunks)}개 청크로 분할")
+        st.info(f"📦 총 {chunk_count}개 청크 생성됨")
+        logger.info(f"텍스트를 {chunk_count}개 청크로 분할")
 
         try:
-            vector_store = SimpleVectorStore(self.api_key)
-            vector_store.add_texts(chunks)
+            chunks = (full_text[start:start + RAGConfig.CHUNK_SIZE] for start in starts)
+            if CacheConfig.ENABLE_EMBEDDING_CACHE:
+                vector_store = _build_vector_store(
+                    self.api_key,
+                    doc_hash or self._hash_document(full_text),
+                    chunks,
+                    chunk_count
+                )
+            else:
+                vector_store = _new_vector_store(self.api_key, chunks, chunk_count)
             logger.info("벡터 스토어 생성 완료")
             return vector_store
 
@@ -143,6 +557,89 @@ class KOICAAuditorStreamlit:
             st.code(traceback.format_exc())
             return None
 
+    def _iter_chunks(
+        self,
+        text: str,
+        chunk_size: int = RAGConfig.CHUNK_SIZE,
+        overlap: int = RAGConfig.CHUNK_OVERLAP
+    ) -> Iterator[str]:
+        """텍스트를 청크 단위로 순차 생성
+
+        오프셋만 계산하고 청크 문자열은 소비 시점에 한 번만 슬라이싱합니다.
+
+        Args:
+            text: 분할할 텍스트
+            chunk_size: 청크 크기
+            overlap: 중첩 크기
+
+        Yields:
+            청크 문자열
+
+        Raises:
+            ValueError: 중첩 크기가 청크 크기 이상인 경우
+        """
+        if overlap >= chunk_size:
+            raise ValueError(f"중첩 크기({overlap})는 청크 크기({chunk_size})보다 작아야 합니다")
+
+        for start in self._chunk_starts(len(text), chunk_size, overlap):
+            yield text[start:start + chunk_size]
+
+    @staticmethod
+    def _unique_chunk_starts(
+        text: str,
+        chunk_size: int = RAGConfig.CHUNK_SIZE,
+        overlap: int = RAGConfig.CHUNK_OVERLAP
+    ) -> List[int]:
+        """공백 차이만 있는 중복 청크를 제외한 청크 시작 오프셋
+
+        반복되는 머리글/표처럼 내용이 같은 청크는 첫 번째만 임베딩·저장합니다.
+        검색 결과는 청크 텍스트이므로 제외된 청크를 따로 되찾을 필요가 없습니다.
+
+        Args:
+            text: 분할할 텍스트
+            chunk_size: 청크 크기
+            overlap: 중첩 크기 (chunk_size 이상이면 빈 리스트)
+
+        Returns:
+            중복이 제거된 청크의 시작 오프셋 리스트
+        """
+        if overlap >= chunk_size:
+            return []
+
+        all_starts = KOICAAuditorStreamlit._chunk_starts(len(text), chunk_size, overlap)
+        seen = set()
+        starts = []
+        for start in all_starts:
+            key = _normalized_hash(text[start:start + chunk_size], digest_size=16)
+            if key not in seen:
+                seen.add(key)
+                starts.append(start)
+
+        skipped = len(all_starts) - len(starts)
+        if skipped:
+            logger.info(f"중복 청크 {skipped}개 제외")
+        return starts
+
+    @staticmethod
+    def _chunk_starts(length: int, chunk_size: int, overlap: int) -> range:
+        """청크 시작 오프셋
+
+        남은 길이가 중첩 크기 이하인 위치에서는 청크를 시작하지 않습니다.
+        그런 꼬리 청크는 앞 청크의 중첩 구간에 이미 모두 포함되어 있어
+        같은 내용을 한 번 더 임베딩하게 됩니다.
+
+        Args:
+            length: 텍스트 길이
+            chunk_size: 청크 크기
+            overlap: 중첩 크기 (chunk_size보다 작아야 함)
+
+        Returns:
+            시작 오프셋 range (빈 텍스트면 빈 range)
+        """
+        if length == 0:
+            return range(0)
+        return range(0, max(length - overlap, 1), chunk_size - overlap)
+
     def _split_text(
         self,
         text: str,
@@ -159,19 +656,40 @@ class KOICAAuditorStreamlit:
         Returns:
             청크 리스트
         """
-        chunks = []
-        start = 0
-        text_length = len(text)
-
-        while start < text_length:
-            end = start + chunk_size
-            chunk = text[start:end]
-            chunks.append(chunk)
-            start = end - overlap
-
+        chunks = list(self._iter_chunks(text, chunk_size, overlap))
         logger.debug(f"텍스트 분할 완료: {len(chunks)}개 청크")
         return chunks
 
+    @staticmethod
+    def _join_chunks(docs: List[str]) -> str:
+        """검색된 청크를 중복 없이 컨텍스트 길이 제한까지만 연결
+
+        보고서마다 반복되는 머리글/표 등 내용이 같은 청크는 한 번만 넣고,
+        제한을 넘는 청크는 잘라 붙이지 않고 제외해 남는 공간을 다른 청크에 씁니다.
+
+        Args:
+            docs: 유사도 순으로 정렬된 청크 리스트
+
+        Returns:
+            구분자로 연결된 컨텍스트
+        """
+        selected: List[str] = []
+        seen = set()
+        length = 0
+
+        for doc in docs:
+            key = doc.strip()
+            if not key or key in seen:
+                continue
+            added = len(doc) + (len(_CHUNK_SEPARATOR) if selected else 0)
+            if selected and length + added > RAGConfig.MAX_CONTEXT_LENGTH:
+                continue
+            seen.add(key)
+            selected.append(doc)
+            length += added
+
+        return _CHUNK_SEPARATOR.join(selected)
+
     def get_relevant_context(
         self,
         vector_store: SimpleVectorStore,
@@ -194,7 +712,7 @@ class KOICAAuditorStreamlit:
 
         try:
             docs = vector_store.similarity_search(query, k=k)
-            context = "\n---\n".join(docs)
+            context = self._join_chunks(docs)
             logger.debug(f"컨텍스트 검색 완료: {len(docs)}개 청크, {len(context)} 문자")
             return context
 
@@ -203,60 +721,97 @@ class KOICAAuditorStreamlit:
             st.warning(f"관련 컨텍스트 검색 오류: {e}")
             return ""
 
+    def get_relevant_contexts(
+        self,
+        vector_store: SimpleVectorStore,
+        queries: List[str],
+        k: int = RAGConfig.DEFAULT_K_SEARCH
+    ) -> List[str]:
+        """여러 쿼리의 관련 컨텍스트를 한 번의 쿼리 임베딩 요청으로 검색
+
+        Args:
+            vector_store: 벡터 스토어
+            queries: 검색 쿼리 리스트
+            k: 쿼리별 검색할 문서 수
+
+        Returns:
+            쿼리 순서대로 검색된 컨텍스트 리스트
+        """
+        if vector_store is None:
+            logger.warning("벡터 스토어가 없어 빈 컨텍스트 반환")
+            return ["" for _ in queries]
+
+        try:
+            docs_per_query = vector_store.similarity_search_batch(queries, k=k)
+            contexts = [self._join_chunks(docs) for docs in docs_per_query]
+            logger.debug(f"일괄 컨텍스트 검색 완료: {[len(c) for c in contexts]} 문자")
+            return contexts
+
+        except Exception as e:
+            logger.error(f"관련 컨텍스트 일괄 검색 오류: {e}")
+            st.warning(f"관련 컨텍스트 검색 오류: {e}")
+            return ["" for _ in queries]
+
     def analyze_policy_alignment(
         self,
         vector_store: Optional[SimpleVectorStore] = None,
-        full_text: str = ""
+        full_text: str = "",
+        context: Optional[str] = None,
+        cached_content: Optional[genai.caching.CachedContent] = None,
+        status: Optional[Any] = None
     ) -> AuditEvidence:
         """[RAG 적용] 국내외 정책 부합성 AI 분석
 
         Args:
             vector_store: RAG용 벡터 스토어 (선택)
             full_text: 전체 텍스트 (fallback)
+            context: 미리 검색된 컨텍스트 (있으면 검색 생략)
+            cached_content: 보고서 본문 컨텍스트 캐시 (있으면 본문을 프롬프트에 넣지 않음)
+            status: 응답 수신 상황을 표시할 st.empty() 자리 (없으면 새로 생성)
 
         Returns:
             정책 부합성 심사 결과
         """
         # RAG: 관련성 높은 컨텍스트 검색
-        if vector_store:
-            query = "국내외 정책 부합성, SDGs, 수원국 개발 정책, 한국 정부 CPS, 코이카 중기 전략, 타 공여기관 지원 현황, ODA"
+        if context is None and vector_store:
             context = self.get_relevant_context(
                 vector_store,
-                query,
+                RAGConfig.POLICY_ALIGNMENT_QUERY,
                 k=RAGConfig.TOP_K_DOCUMENTS
             )
-        else:
-            context = full_text[:RAGConfig.MAX_CONTEXT_LENGTH] if full_text else ""
+        elif context is None:
+            context = full_text
+
+        # 컨텍스트 길이 제한은 여기서 한 번만 적용
+        context = context[:RAGConfig.MAX_CONTEXT_LENGTH]
 
         if not context:
             context = "보고서에서 관련 내용을 찾을 수 없습니다."
             logger.warning("정책부합성 분석용 컨텍스트 없음")
 
-        prompt = self._build_policy_alignment_prompt(context)
+        if cached_content is not None:
+            prompt = self._build_policy_alignment_prompt(_CACHED_CONTEXT_NOTE)
+        else:
+            prompt = self._build_policy_alignment_prompt(context)
 
         try:
-            response = self.model.generate_content(prompt)
-            result = self._parse_and_validate_response(
-                response.text,
-                required_keys=['total_score', 'detailed_scores']
-            )
+            response_text = self._generate_streaming(prompt, cached_content, "정책부합성", status)
+            result = AnalysisResponse.model_validate_json(response_text)
 
-            logger.info(f"정책부합성 분석 완료: {result.get('total_score', 0)}점")
+            logger.info(f"정책부합성 분석 완료: {result.total_score}점")
             return self._create_audit_evidence(
                 result,
                 max_score=AuditConfig.POLICY_ALIGNMENT_MAX_SCORE
             )
 
-        except json.JSONDecodeError as e:
-            logger.error(f"정책부합성 분석 JSON 파싱 실패: {e}")
-            st.error(f"정책부합성 분석 결과 파싱 실패: {e}")
+        except ValidationError as e:
+            logger.error(f"정책부합성 분석 응답 검증 실패: {e}")
             return AuditEvidence.create_failed(
                 AuditConfig.POLICY_ALIGNMENT_MAX_SCORE,
-                f"JSON 파싱 실패: {e}"
+                f"응답 검증 실패: {e}"
             )
         except Exception as e:
             logger.error(f"정책부합성 분석 오류: {e}")
-            st.error(f"정책부합성 분석 오류: {e}")
             return AuditEvidence.create_failed(
                 AuditConfig.POLICY_ALIGNMENT_MAX_SCORE,
                 str(e)
@@ -265,182 +820,363 @@ class KOICAAuditorStreamlit:
     def analyze_implementation_readiness(
         self,
         vector_store: Optional[SimpleVectorStore] = None,
-        full_text: str = ""
+        full_text: str = "",
+        context: Optional[str] = None,
+        cached_content: Optional[genai.caching.CachedContent] = None,
+        status: Optional[Any] = None
     ) -> AuditEvidence:
         """[RAG 적용] 사업 추진 여건 AI 분석
 
         Args:
             vector_store: RAG용 벡터 스토어 (선택)
             full_text: 전체 텍스트 (fallback)
+            context: 미리 검색된 컨텍스트 (있으면 검색 생략)
+            cached_content: 보고서 본문 컨텍스트 캐시 (있으면 본문을 프롬프트에 넣지 않음)
+            status: 응답 수신 상황을 표시할 st.empty() 자리 (없으면 새로 생성)
 
         Returns:
             추진 여건 심사 결과
         """
-        if vector_store:
-            query = "사업 추진 여건, 수원국 추진체계, 국내 추진체계, 사업 추진전략, 리스크 관리, 성과관리, 예산, 일정"
+        if context is None and vector_store:
             context = self.get_relevant_context(
                 vector_store,
-                query,
+                RAGConfig.IMPLEMENTATION_READINESS_QUERY,
                 k=RAGConfig.TOP_K_DOCUMENTS
             )
-        else:
-            context = full_text[:RAGConfig.MAX_CONTEXT_LENGTH] if full_text else ""
+        elif context is None:
+            context = full_text
+
+        # 컨텍스트 길이 제한은 여기서 한 번만 적용
+        context = context[:RAGConfig.MAX_CONTEXT_LENGTH]
 
         if not context:
             context = "보고서에서 관련 내용을 찾을 수 없습니다."
             logger.warning("추진여건 분석용 컨텍스트 없음")
 
-        prompt = self._build_implementation_readiness_prompt(context)
+        if cached_content is not None:
+            prompt = self._build_implementation_readiness_prompt(_CACHED_CONTEXT_NOTE)
+        else:
+            prompt = self._build_implementation_readiness_prompt(context)
 
         try:
-            response = self.model.generate_content(prompt)
-            result = self._parse_and_validate_response(
-                response.text,
-                required_keys=['total_score', 'detailed_scores']
-            )
+            response_text = self._generate_streaming(prompt, cached_content, "추진여건", status)
+            result = AnalysisResponse.model_validate_json(response_text)
 
-            logger.info(f"추진여건 분석 완료: {result.get('total_score', 0)}점")
+            logger.info(f"추진여건 분석 완료: {result.total_score}점")
             return self._create_audit_evidence(
                 result,
                 max_score=AuditConfig.IMPLEMENTATION_READINESS_MAX_SCORE
             )
 
-        except json.JSONDecodeError as e:
-            logger.error(f"추진여건 분석 JSON 파싱 실패: {e}")
-            st.error(f"추진여건 분석 결과 파싱 실패: {e}")
+        except ValidationError as e:
+            logger.error(f"추진여건 분석 응답 검증 실패: {e}")
             return AuditEvidence.create_failed(
                 AuditConfig.IMPLEMENTATION_READINESS_MAX_SCORE,
-                f"JSON 파싱 실패: {e}"
+                f"응답 검증 실패: {e}"
             )
         except Exception as e:
             logger.error(f"추진여건 분석 오류: {e}")
-            st.error(f"추진여건 분석 오류: {e}")
             return AuditEvidence.create_failed(
                 AuditConfig.IMPLEMENTATION_READINESS_MAX_SCORE,
                 str(e)
             )
 
-    def _build_policy_alignment_prompt(self, context: str) -> str:
-        """정책 부합성 분석 프롬프트 생성"""
-        return f"""당신은 KOICA 사업 심사 전문가입니다. 다음 보고서 발췌 내용을 '국내외 정책 부합성' 기준으로 평가하세요.
-
-=== 평가 기준 (30점 만점) ===
-1. SDGs와의 연관성 (10점)
-2. 수원국 정책 부합성 (5점)
-3. 한국 정부 CPS 및 국정과제 연계 (5점)
-4. 코이카 중기전략 부합성 (5점)
-5. 타 공여기관 중복 분석 (5점)
+    def _generate_streaming(
+        self,
+        prompt: str,
+        cached_content: Optional[genai.caching.CachedContent],
+        label: str,
+        status: Optional[Any] = None
+    ) -> str:
+        """응답을 스트리밍으로 받아 수신 상황을 표시하고 전체 JSON 텍스트 반환
 
-=== 보고서 발췌 내용 ===
-{context[:RAGConfig.MAX_CONTEXT_LENGTH]}
-
-=== 출력 형식 (JSON) ===
-{{
-  "total_score": 0-30 사이 정수,
-  "detailed_scores": [
-    {{"item": "SDGs", "score": 0-10, "max_score": 10, "reason": "SDGs 연관성에 대한 평가 근거"}},
-    {{"item": "수원국 정책", "score": 0-5, "max_score": 5, "reason": "수원국 정책 부합성에 대한 평가 근거"}},
-    {{"item": "CPS/국정과제", "score": 0-5, "max_score": 5, "reason": "CPS/국정과제 연계성에 대한 평가 근거"}},
-    {{"item": "코이카 전략", "score": 0-5, "max_score": 5, "reason": "코이카 중기전략 부합성에 대한 평가 근거"}},
-    {{"item": "타 공여기관", "score": 0-5, "max_score": 5, "reason": "타 공여기관 중복 분석에 대한 평가 근거"}}
-  ],
-  "reasoning": "점수 산정 논리 상세 설명",
-  "strengths": ["발견된 모든 강점을 나열"],
-  "weaknesses": ["발견된 모든 약점을 나열"],
-  "recommendations": ["필요한 모든 개선안을 나열"]
-}}
-
-**주의**: strengths, weaknesses, recommendations는 각각 발견된 모든 내용을 빠짐없이 나열해주세요.
-JSON만 출력하세요."""
+        첫 토큰부터 진행 상황이 보이도록 조각마다 수신 글자 수를 갱신하고,
+        조각은 리스트에 모았다가 스트림이 끝나면 한 번에 연결합니다.
 
-    def _build_implementation_readiness_prompt(self, context: str) -> str:
-        """추진 여건 분석 프롬프트 생성"""
-        return f"""당신은 KOICA 사업 심사 전문가입니다. 다음 보고서 발췌 내용을 '사업 추진 여건' 기준으로 평가하세요.
+        Args:
+            prompt: 분석 프롬프트
+            cached_content: 보고서 본문 컨텍스트 캐시 (선택)
+            label: 표시용 분석 이름
+            status: 수신 상황을 표시할 st.empty() 자리 (없으면 새로 생성)
 
-=== 평가 기준 (70점 만점) ===
-1. 수원국 추진체계 (20점)
-2. 국내 추진체계 (15점)
-3. 사업 추진전략 (15점)
-4. 리스크 관리 (10점)
-5. 성과관리 (10점)
+        Returns:
+            응답 전체 텍스트
+        """
+        status = status if status is not None else st.empty()
+        parts: List[str] = []
+        received = 0
 
-=== 보고서 발췌 내용 ===
-{context[:RAGConfig.MAX_CONTEXT_LENGTH]}
-
-=== 출력 형식 (JSON) ===
-{{
-  "total_score": 0-70 사이 정수,
-  "detailed_scores": [
-    {{"item": "수원국 추진체계", "score": 0-20, "max_score": 20, "reason": "평가 근거"}},
-    {{"item": "국내 추진체계", "score": 0-15, "max_score": 15, "reason": "평가 근거"}},
-    {{"item": "사업 추진전략", "score": 0-15, "max_score": 15, "reason": "평가 근거"}},
-    {{"item": "리스크 관리", "score": 0-10, "max_score": 10, "reason": "평가 근거"}},
-    {{"item": "성과관리", "score": 0-10, "max_score": 10, "reason": "평가 근거"}}
-  ],
-  "reasoning": "점수 산정 논리 상세 설명",
-  "strengths": ["발견된 모든 강점을 나열"],
-  "weaknesses": ["발견된 모든 약점을 나열"],
-  "recommendations": ["필요한 모든 개선안을 나열"]
-}}
-
-**주의**: strengths, weaknesses, recommendations는 각각 발견된 모든 내용을 빠짐없이 나열해주세요.
-JSON만 출력하세요."""
+        try:
+            stream = self._model_for(cached_content).generate_content(
+                prompt,
+                stream=True,
+                request_options={"timeout": APIConfig.GENERATION_TIMEOUT}
+            )
+            for chunk in stream:
+                text = "".join(part.text for part in chunk.parts)
+                if not text:
+                    continue
+                parts.append(text)
+                received += len(text)
+                status.caption(f"✍️ {label} 응답 수신 중... ({received:,}자)")
+        finally:
+            status.empty()
+
+        self._log_usage(label, stream)
+        return "".join(parts)
 
     @staticmethod
-    def _parse_and_validate_response(
-        response_text: str,
-        required_keys: List[str]
-    ) -> Dict[str, Any]:
-        """API 응답 파싱 및 검증
+    def _log_usage(label: str, response: Any) -> None:
+        """토큰 사용량 기록 (암묵적/명시적 캐시 적중 토큰 수 확인용)"""
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        logger.info(
+            f"{label} 토큰 사용: 입력 {usage.prompt_token_count} "
+            f"(캐시 {getattr(usage, 'cached_content_token_count', 0)}), "
+            f"출력 {usage.candidates_token_count}"
+        )
+
+    def _model_for(self, cached_content: Optional[genai.caching.CachedContent]) -> genai.GenerativeModel:
+        """컨텍스트 캐시가 있으면 캐시 기반 모델, 없으면 기본 모델 반환"""
+        if cached_content is None:
+            return self.model
+        return genai.GenerativeModel.from_cached_content(
+            cached_content,
+            generation_config=self.json_config
+        )
+
+    def _create_context_cache(self, text: str) -> Optional[genai.caching.CachedContent]:
+        """두 분석이 공유하는 보고서 본문을 Gemini 컨텍스트 캐시에 업로드
+
+        본문이 짧거나(최소 캐시 토큰 수 미달) 생성에 실패하면 None을 반환하고
+        기존처럼 프롬프트에 본문을 직접 넣습니다.
 
         Args:
-            response_text: JSON 응답 텍스트
-            required_keys: 필수 키 리스트
+            text: 공유 본문
 
         Returns:
-            파싱된 딕셔너리
-
-        Raises:
-            json.JSONDecodeError: JSON 파싱 실패
-            KeyError: 필수 키 누락
+            CachedContent 또는 None
         """
-        result = json.loads(response_text)
+        if not APIConfig.ENABLE_CONTEXT_CACHE or len(text) < APIConfig.CONTEXT_CACHE_MIN_CHARS:
+            return None
+
+        try:
+            cached_content = genai.caching.CachedContent.create(
+                model=f"models/{self.model_name}",
+                display_name="koica-report",
+                contents=[text],
+                ttl=timedelta(seconds=APIConfig.CONTEXT_CACHE_TTL)
+            )
+            logger.info(f"컨텍스트 캐시 생성: {cached_content.name}")
+            return cached_content
+
+        except Exception as e:
+            logger.warning(f"컨텍스트 캐시 생성 실패, 본문을 프롬프트에 포함: {e}")
+            return None
 
-        # 필수 키 검증
-        for key in required_keys:
-            if key not in result:
-                raise KeyError(f"필수 키 '{key}'가 응답에 없습니다")
+    def _build_policy_alignment_prompt(self, context: str) -> str:
+        """정책 부합성 분석 프롬프트 생성 (중간 문자열 없이 한 번에 연결)"""
+        return "".join((_POLICY_ALIGNMENT_PREFIX, context, _POLICY_ALIGNMENT_SUFFIX))
 
-        return result
+    def _build_implementation_readiness_prompt(self, context: str) -> str:
+        """추진 여건 분석 프롬프트 생성 (중간 문자열 없이 한 번에 연결)"""
+        return "".join((_IMPLEMENTATION_READINESS_PREFIX, context, _IMPLEMENTATION_READINESS_SUFFIX))
 
     @staticmethod
-    def _create_audit_evidence(result: Dict[str, Any], max_score: int) -> AuditEvidence:
-        """API 응답에서 AuditEvidence 객체 생성
+    def _create_audit_evidence(result: AnalysisResponse, max_score: int) -> AuditEvidence:
+        """검증된 API 응답에서 AuditEvidence 객체 생성
 
         Args:
-            result: 파싱된 API 응답
+            result: 검증된 분석 응답
             max_score: 만점
 
         Returns:
             AuditEvidence 객체
         """
-        score = result.get('total_score', 0)
+        score = result.total_score
         return AuditEvidence(
             score=score,
             max_score=max_score,
             percentage=round(score / max_score * 100, 1) if max_score > 0 else 0.0,
-            detailed_scores=result.get('detailed_scores', []),
-            reasoning=result.get('reasoning', ''),
-            strengths=result.get('strengths', []),
-            weaknesses=result.get('weaknesses', []),
-            recommendations=result.get('recommendations', [])
+            detailed_scores=[item.model_dump() for item in result.detailed_scores],
+            reasoning=result.reasoning,
+            strengths=result.strengths,
+            weaknesses=result.weaknesses,
+            recommendations=result.recommendations
+        )
+
+    @staticmethod
+    def build_results(
+        policy_result: AuditEvidence,
+        impl_result: AuditEvidence,
+        duration: float,
+        rag_used: bool
+    ) -> Dict[str, Any]:
+        """두 분석 결과를 화면/보고서용 결과 딕셔너리로 종합
+
+        Args:
+            policy_result: 정책 부합성 결과
+            impl_result: 추진 여건 결과
+            duration: 분석 소요 시간 (초)
+            rag_used: RAG 사용 여부
+
+        Returns:
+            심사 결과 딕셔너리
+        """
+        return {
+            "총점": policy_result.score + impl_result.score,
+            "정책부합성": {
+                "점수": policy_result.score,
+                "만점": policy_result.max_score,
+                "백분율": policy_result.percentage,
+                "세부점수": policy_result.detailed_scores,
+                "강점": policy_result.strengths,
+                "약점": policy_result.weaknesses,
+                "제안": policy_result.recommendations
+            },
+            "추진여건": {
+                "점수": impl_result.score,
+                "만점": impl_result.max_score,
+                "백분율": impl_result.percentage,
+                "세부점수": impl_result.detailed_scores,
+                "강점": impl_result.strengths,
+                "약점": impl_result.weaknesses,
+                "제안": impl_result.recommendations
+            },
+            "분석시간": f"{duration:.1f}초",
+            "RAG_사용": rag_used
+        }
+
+    def build_analysis_prompts(
+        self,
+        full_text: str,
+        doc_hash: Optional[str] = None
+    ) -> Tuple[str, str, bool]:
+        """배치 제출용으로 두 분석 프롬프트를 미리 생성 (Gemini 호출 없음)
+
+        동기 분석과 같은 RAG 검색/길이 제한을 적용하며, 임베딩만 즉시 계산합니다.
+
+        Args:
+            full_text: 심사할 전체 텍스트
+            doc_hash: 문서 해시 (없으면 텍스트로 계산)
+
+        Returns:
+            (정책 부합성 프롬프트, 추진 여건 프롬프트, RAG 사용 여부)
+        """
+        vector_store = self.create_vector_store(full_text, doc_hash=doc_hash or self._hash_document(full_text))
+
+        if vector_store:
+            contexts = self.get_relevant_contexts(
+                vector_store,
+                [RAGConfig.POLICY_ALIGNMENT_QUERY, RAGConfig.IMPLEMENTATION_READINESS_QUERY],
+                k=RAGConfig.TOP_K_DOCUMENTS
+            )
+        else:
+            contexts = [full_text, full_text]
+
+        policy_context, impl_context = (
+            context[:RAGConfig.MAX_CONTEXT_LENGTH] or "보고서에서 관련 내용을 찾을 수 없습니다."
+            for context in contexts
+        )
+        return (
+            self._build_policy_alignment_prompt(policy_context),
+            self._build_implementation_readiness_prompt(impl_context),
+            vector_store is not None
         )
 
-    def conduct_audit(self, full_text: str) -> Optional[Dict[str, Any]]:
+    def parse_analysis_response(self, text: Optional[str], max_score: int) -> AuditEvidence:
+        """배치 응답 텍스트를 AuditEvidence로 변환
+
+        Args:
+            text: 모델 응답 JSON 텍스트 (요청 실패 시 None)
+            max_score: 만점
+
+        Returns:
+            AuditEvidence 객체 (응답이 없거나 검증에 실패하면 실패 결과)
+        """
+        if not text:
+            return AuditEvidence.create_failed(max_score, "배치 응답 없음")
+
+        try:
+            return self._create_audit_evidence(AnalysisResponse.model_validate_json(text), max_score)
+        except ValidationError as e:
+            logger.error(f"배치 응답 검증 실패: {e}")
+            return AuditEvidence.create_failed(max_score, f"응답 검증 실패: {e}")
+
+    def _run_analyses(
+        self,
+        vector_store: Optional[SimpleVectorStore],
+        full_text: str
+    ) -> Tuple[AuditEvidence, AuditEvidence]:
+        """정책 부합성과 추진 여건 분석을 동시에 수행
+
+        두 Gemini 호출은 네트워크 대기가 대부분이므로 스레드로 겹쳐 실행합니다.
+        워커 스레드는 미리 만든 수신 상황 자리만 갱신하고, 실패 메시지는
+        두 분석이 모두 끝난 뒤 스크립트 스레드에서 표시합니다.
+
+        Args:
+            vector_store: RAG용 벡터 스토어 (선택)
+            full_text: 전체 텍스트 (fallback)
+
+        Returns:
+            (정책 부합성 결과, 추진 여건 결과)
+        """
+        # RAG: 두 분석의 검색 쿼리를 한 번의 임베딩 요청으로 처리
+        policy_context, impl_context = None, None
+        if vector_store:
+            policy_context, impl_context = self.get_relevant_contexts(
+                vector_store,
+                [RAGConfig.POLICY_ALIGNMENT_QUERY, RAGConfig.IMPLEMENTATION_READINESS_QUERY],
+                k=RAGConfig.TOP_K_DOCUMENTS
+            )
+
+        # RAG를 쓰지 못하면 두 분석이 같은 본문을 보내므로 컨텍스트 캐시로 한 번만 업로드
+        cached_content = None
+        if not vector_store:
+            cached_content = self._create_context_cache(full_text[:RAGConfig.MAX_CONTEXT_LENGTH])
+
+        # 워커 스레드가 동시에 요소를 만들지 않도록 수신 상황 표시 자리는 미리 생성
+        policy_status, impl_status = st.empty(), st.empty()
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=2,
+                initializer=add_script_run_ctx,
+                initargs=(None, get_script_run_ctx())
+            ) as executor:
+                policy_future = executor.submit(
+                    self.analyze_policy_alignment,
+                    vector_store, full_text, policy_context, cached_content, policy_status
+                )
+                impl_future = executor.submit(
+                    self.analyze_implementation_readiness,
+                    vector_store, full_text, impl_context, cached_content, impl_status
+                )
+                policy_result, impl_result = policy_future.result(), impl_future.result()
+
+            for label, result in (("정책부합성", policy_result), ("추진여건", impl_result)):
+                if result.failed:
+                    st.error(f"{label} {result.reasoning}")
+            return policy_result, impl_result
+
+        finally:
+            if cached_content is not None:
+                try:
+                    cached_content.delete()
+                except Exception as e:
+                    logger.warning(f"컨텍스트 캐시 삭제 실패: {e}")
+
+    def conduct_audit(
+        self,
+        full_text: str,
+        doc_hash: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """전체 심사 수행 (RAG 기반)
 
         Args:
             full_text: 심사할 전체 텍스트
+            doc_hash: 문서 해시 (PDF는 원본 파일 해시, 없으면 텍스트로 계산)
 
         Returns:
             심사 결과 딕셔너리 또는 None
@@ -448,51 +1184,55 @@ JSON만 출력하세요."""
         start_time = datetime.now()
         logger.info("심사 시작")
 
+        doc_hash = doc_hash or self._hash_document(full_text)
+        # API 키 원문 대신 지문을 키에 사용
+        cache_key = (doc_hash, self.model_name, self._api_key_fingerprint)
+
+        # 공백만 다른 재업로드(다시 내보낸 PDF 등)는 정규화 텍스트 해시로 같은 문서로 취급
+        normalized_key = None
+        if CacheConfig.ENABLE_NORMALIZED_RESULT_CACHE:
+            normalized_key = ("text:" + _normalized_hash(full_text).hex(), *cache_key[1:])
+
+        if CacheConfig.ENABLE_RESULT_CACHE:
+            cached = _get_cached_result(cache_key)
+            if cached is not None:
+                logger.info(f"심사 결과 캐시 적중: {doc_hash[:12]}...")
+                st.info("♻️ 동일한 문서의 이전 분석 결과를 재사용합니다.")
+                return cached
+
+            cached = _get_cached_result(normalized_key) if normalized_key else None
+            if cached is not None:
+                logger.info(f"정규화 텍스트 결과 캐시 적중: {doc_hash[:12]}...")
+                st.info("♻️ 공백만 다른 동일 문서의 이전 분석 결과를 재사용합니다.")
+                _put_cached_result(cache_key, cached)
+                return cached
+
         try:
             # 1. 벡터 스토어 생성 시도
-            vector_store = self.create_vector_store(full_text)
+            vector_store = self.create_vector_store(full_text, doc_hash=doc_hash)
 
             if not vector_store:
                 st.warning("⚠️ RAG 모드 실패. 전체 텍스트 앞부분으로 분석합니다.")
                 logger.warning("RAG 모드 실패, fallback으로 진행")
 
-            # 2. 정책 부합성 분석
-            with st.spinner("🌍 정책 부합성 분석 중..."):
-                policy_result = self.analyze_policy_alignment(vector_store, full_text)
-
-            # 3. 추진 여건 분석
-            with st.spinner("🏗️ 사업 추진 여건 분석 중..."):
-                impl_result = self.analyze_implementation_readiness(vector_store, full_text)
+            # 2~3. 정책 부합성 / 추진 여건 분석 (서로 독립적이므로 동시 수행)
+            with st.spinner("🌍🏗️ 정책 부합성 및 사업 추진 여건 분석 중..."):
+                policy_result, impl_result = self._run_analyses(vector_store, full_text)
 
             # 4. 결과 종합
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
 
-            results = {
-                "총점": policy_result.score + impl_result.score,
-                "정책부합성": {
-                    "점수": policy_result.score,
-                    "만점": policy_result.max_score,
-                    "백분율": policy_result.percentage,
-                    "세부점수": policy_result.detailed_scores,
-                    "강점": policy_result.strengths,
-                    "약점": policy_result.weaknesses,
-                    "제안": policy_result.recommendations
-                },
-                "추진여건": {
-                    "점수": impl_result.score,
-                    "만점": impl_result.max_score,
-                    "백분율": impl_result.percentage,
-                    "세부점수": impl_result.detailed_scores,
-                    "강점": impl_result.strengths,
-                    "약점": impl_result.weaknesses,
-                    "제안": impl_result.recommendations
-                },
-                "분석시간": f"{duration:.1f}초",
-                "RAG_사용": vector_store is not None
-            }
+            results = self.build_results(policy_result, impl_result, duration, vector_store is not None)
 
             logger.info(f"심사 완료: 총점 {results['총점']}/100, 소요시간 {duration:.1f}초")
+
+            # 두 분석이 모두 성공한 경우에만 결과 캐시
+            if CacheConfig.ENABLE_RESULT_CACHE and not (policy_result.failed or impl_result.failed):
+                _put_cached_result(cache_key, results)
+                if normalized_key:
+                    _put_cached_result(normalized_key, results)
+
             return results
 
         except Exception as e:
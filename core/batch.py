@@ -0,0 +1,146 @@
+"""
+KOICA 사업 예비조사 심사 시스템 - 배치 분석
+여러 보고서의 분석 요청을 Gemini Batch API로 한 번에 제출하고 결과 수집
+"""
+
+import io
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from core.models import AnalysisResponse
+from config import APIConfig
+
+try:
+    from google import genai as genai_sdk
+    BATCH_API_AVAILABLE = True
+except ImportError:  # Batch API는 google-genai SDK에서만 제공
+    genai_sdk = None
+    BATCH_API_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 요청 키 형식: "{문서명}::{분석 종류}"
+POLICY_KEY = "policy"
+IMPLEMENTATION_KEY = "implementation"
+_KEY_SEPARATOR = "::"
+
+# 완료 후 더 이상 바뀌지 않는 작업 상태
+TERMINAL_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+})
+
+
+class BatchAuditClient:
+    """Gemini Batch API 클라이언트
+
+    문서마다 정책 부합성/추진 여건 두 요청을 JSONL 한 줄씩 작성해 업로드하고,
+    완료된 작업의 결과 파일을 키 기준으로 문서별로 다시 묶습니다.
+    """
+
+    def __init__(self, api_key: str, model: str = APIConfig.GENERATIVE_MODEL):
+        """
+        Args:
+            api_key: Google API 키
+            model: 분석 모델명
+        """
+        if not BATCH_API_AVAILABLE:
+            raise RuntimeError("배치 분석에는 google-genai 패키지가 필요합니다.")
+
+        self.model = model
+        self.client = genai_sdk.Client(api_key=api_key)
+
+    @staticmethod
+    def _request_line(key: str, prompt: str) -> str:
+        """JSONL 요청 한 줄 생성 (동기 분석과 같은 응답 스키마 적용)"""
+        return json.dumps({
+            "key": key,
+            "request": {
+                "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                "generation_config": {
+                    "response_mime_type": "application/json",
+                    "response_json_schema": AnalysisResponse.model_json_schema()
+                }
+            }
+        }, ensure_ascii=False)
+
+    def submit(self, prompts: Dict[str, Tuple[str, str]], display_name: str = "koica-batch-audit") -> str:
+        """배치 작업 제출
+
+        Args:
+            prompts: 문서명 → (정책 부합성 프롬프트, 추진 여건 프롬프트)
+            display_name: 작업 표시 이름
+
+        Returns:
+            배치 작업 이름 (결과 조회에 사용)
+        """
+        lines = []
+        for doc_name, (policy_prompt, impl_prompt) in prompts.items():
+            lines.append(self._request_line(f"{doc_name}{_KEY_SEPARATOR}{POLICY_KEY}", policy_prompt))
+            lines.append(self._request_line(f"{doc_name}{_KEY_SEPARATOR}{IMPLEMENTATION_KEY}", impl_prompt))
+
+        uploaded = self.client.files.upload(
+            file=io.BytesIO("\n".join(lines).encode('utf-8')),
+            config={"display_name": display_name, "mime_type": "jsonl"}
+        )
+        job = self.client.batches.create(
+            model=self.model,
+            src=uploaded.name,
+            config={"display_name": display_name}
+        )
+        logger.info(f"배치 작업 제출: {job.name} (문서 {len(prompts)}개, 요청 {len(lines)}개)")
+        return job.name
+
+    def get_job(self, job_name: str) -> Any:
+        """배치 작업 상태 조회
+
+        Args:
+            job_name: 배치 작업 이름
+
+        Returns:
+            BatchJob 객체 (`job.state.name`으로 상태 확인)
+        """
+        return self.client.batches.get(name=job_name)
+
+    def fetch_results(self, job: Any) -> Dict[str, Dict[str, Optional[str]]]:
+        """완료된 작업의 결과 파일을 내려받아 문서별 응답 텍스트로 정리
+
+        Args:
+            job: JOB_STATE_SUCCEEDED 상태의 BatchJob
+
+        Returns:
+            문서명 → {"policy": 응답 텍스트, "implementation": 응답 텍스트}
+            (개별 요청이 실패한 경우 해당 값은 None)
+        """
+        content = self.client.files.download(file=job.dest.file_name)
+        results: Dict[str, Dict[str, Optional[str]]] = {}
+
+        for line in content.decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+
+            item = json.loads(line)
+            doc_name, _, kind = item.get("key", "").rpartition(_KEY_SEPARATOR)
+            results.setdefault(doc_name, {POLICY_KEY: None, IMPLEMENTATION_KEY: None})
+
+            if "error" in item:
+                logger.error(f"배치 요청 실패 ({item['key']}): {item['error']}")
+                continue
+
+            try:
+                parts = item["response"]["candidates"][0]["content"]["parts"]
+                results[doc_name][kind] = "".join(part.get("text", "") for part in parts)
+            except (KeyError, IndexError, TypeError) as e:
+                logger.error(f"배치 응답 형식 오류 ({item['key']}): {e}")
+
+        return results
+
+    @staticmethod
+    def job_duration(job: Any) -> float:
+        """제출부터 완료까지 걸린 시간 (초, 알 수 없으면 0)"""
+        if getattr(job, "create_time", None) and getattr(job, "end_time", None):
+            return (job.end_time - job.create_time).total_seconds()
+        return 0.0
@@ -0,0 +1,135 @@
+"""
+KOICA 사업 예비조사 심사 시스템 - 임베딩 캐시
+청크 임베딩을 디스크(SQLite)에 저장하여 프로세스 재시작 후에도 재사용
+"""
+
+import hashlib
+import logging
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from config import CacheConfig
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """내용 주소 기반 임베딩 캐시
+
+    (임베딩 모델, 작업 유형, 텍스트)의 해시를 키로 float32 벡터를 저장합니다.
+    SQLite 연결은 호출마다 새로 열어 Streamlit 세션 스레드 간에 공유하지 않습니다.
+    """
+
+    def __init__(self, db_path: str = CacheConfig.EMBEDDING_CACHE_PATH):
+        """
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """캐시 테이블 생성"""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL
+                )
+            """)
+            conn.commit()
+
+    @staticmethod
+    def make_key(text: str, model: str, task_type: str) -> str:
+        """캐시 키 생성
+
+        Args:
+            text: 임베딩 대상 텍스트
+            model: 임베딩 모델명
+            task_type: 임베딩 작업 유형
+
+        Returns:
+            BLAKE2b 해시 문자열
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        for part in (model, task_type, text):
+            digest.update(part.encode('utf-8'))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """캐시된 임베딩 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            임베딩 벡터 또는 None
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[float]]:
+        """여러 키의 임베딩 일괄 조회
+
+        Args:
+            keys: 캐시 키 목록
+
+        Returns:
+            적중한 키와 임베딩 벡터의 딕셔너리
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        try:
+            with closing(sqlite3.connect(self.db_path)) as conn:
+                placeholders = ",".join("?" * len(keys))
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    keys
+                ).fetchall()
+            return {
+                key: np.frombuffer(vector, dtype=np.float32).tolist()
+                for key, vector in rows
+            }
+
+        except Exception as e:
+            logger.warning(f"임베딩 캐시 조회 실패: {e}")
+            return {}
+
+    def set(self, key: str, vector: List[float]) -> None:
+        """임베딩 저장
+
+        Args:
+            key: 캐시 키
+            vector: 임베딩 벡터
+        """
+        self.set_many({key: vector})
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        """여러 임베딩 일괄 저장
+
+        Args:
+            items: 캐시 키와 임베딩 벡터의 딕셔너리
+        """
+        if not items:
+            return
+
+        try:
+            with closing(sqlite3.connect(self.db_path)) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [
+                        (key, np.asarray(vector, dtype=np.float32).tobytes())
+                        for key, vector in items.items()
+                    ]
+                )
+                conn.commit()
+
+        except Exception as e:
+            logger.warning(f"임베딩 캐시 저장 실패: {e}")
@@ -6,11 +6,41 @@ KOICA 사업 예비조사 심사 시스템 - 데이터 모델
 from dataclasses import dataclass
 from typing import List, Dict, Any
 
+from pydantic import BaseModel
 
-@dataclass
+
+class ScoreItem(BaseModel):
+    """세부 평가 항목 점수 (Gemini 구조화 출력 스키마)"""
+
+    item: str
+    score: int
+    max_score: int
+    reason: str
+
+
+class AnalysisResponse(BaseModel):
+    """심사 분석 응답 (Gemini 구조화 출력 스키마)
+
+    `response_schema`로 전달되어 모델 출력 형식을 강제하고,
+    응답 텍스트는 `model_validate_json`으로 바로 검증합니다.
+    """
+
+    total_score: int
+    detailed_scores: List[ScoreItem]
+    # 기본값을 두면 JSON 스키마에 `default`가 생겨 google-generativeai가 거부하므로 모두 필수 필드로 선언
+    reasoning: str
+    strengths: List[str]
+    weaknesses: List[str]
+    recommendations: List[str]
+
+
+@dataclass(frozen=True, slots=True)
 class AuditEvidence:
     """심사 근거 데이터 클래스
 
+    생성 후 변경되지 않으므로 frozen/slots로 선언하여
+    인스턴스 `__dict__` 없이 속성을 슬롯에 저장합니다.
+
     Attributes:
         score: 획득 점수
         max_score: 만점
@@ -20,6 +50,7 @@ class AuditEvidence:
         strengths: 강점 리스트
         weaknesses: 약점 리스트
         recommendations: 개선 제안 리스트
+        failed: 분석 실패 여부
     """
 
     score: int
@@ -30,13 +61,14 @@ class AuditEvidence:
     strengths: List[str]
     weaknesses: List[str]
     recommendations: List[str]
+    failed: bool = False
 
     def __post_init__(self):
         """데이터 검증"""
-        if self.score < 0 or self.score > self.max_score:
+        if not 0 <= self.score <= self.max_score:
             raise ValueError(f"점수는 0과 {self.max_score} 사이여야 합니다.")
 
-        if self.percentage < 0 or self.percentage > 100:
+        if not 0 <= self.percentage <= 100:
             raise ValueError("백분율은 0과 100 사이여야 합니다.")
 
     def to_dict(self) -> Dict[str, Any]:
@@ -63,5 +95,6 @@ class AuditEvidence:
             reasoning=f"분석 실패: {error_message}",
             strengths=[],
             weaknesses=[],
-            recommendations=[]
+            recommendations=[],
+            failed=True
         )
@@ -0,0 +1,60 @@
+"""
+KOICA 사업 예비조사 심사 시스템 - 요청 속도 제한
+스레드 간 공유되는 토큰 버킷 (429 응답 시 일시 차단)
+"""
+
+import time
+import threading
+
+
+class TokenBucket:
+    """분당 요청 수 기반 토큰 버킷
+
+    할당량에 여유가 있으면 대기 없이 통과시키고, 토큰이 바닥났거나
+    서버가 429로 대기를 요구한 경우에만 호출 스레드를 멈춥니다.
+    """
+
+    def __init__(self, rate_per_min: float, burst: int):
+        """
+        Args:
+            rate_per_min: 분당 허용 요청 수
+            burst: 한 번에 연속으로 보낼 수 있는 최대 요청 수
+        """
+        self.rate = rate_per_min / 60.0
+        self.capacity = max(burst, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """경과 시간만큼 토큰 보충 (lock 보유 상태에서 호출)"""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: int = 1) -> None:
+        """토큰을 얻을 때까지 대기
+
+        Args:
+            tokens: 필요한 토큰 수 (버킷 용량을 넘으면 용량으로 제한)
+        """
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = max(self._blocked_until - now, (tokens - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def penalize(self, seconds: float) -> None:
+        """서버가 요청한 시간 동안 모든 스레드의 요청 차단
+
+        Args:
+            seconds: 차단 시간 (초, 429 응답의 Retry-After)
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
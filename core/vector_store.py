@@ -3,17 +3,74 @@ KOICA 사업 예비조사 심사 시스템 - 벡터 스토어
 Gemini API를 사용한 간단한 벡터 저장소 구현
 """
 
-import time
+import os
+import json
 import logging
-from typing import List, Optional
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 import numpy as np
 
-from config import RAGConfig, APIConfig
+try:
+    import hnswlib
+except ImportError:  # 선택 의존성: 없으면 FAISS 또는 전수 검색 사용
+    hnswlib = None
+
+try:
+    import faiss
+except ImportError:  # 선택 의존성: hnswlib도 없으면 전수 검색만 사용
+    faiss = None
+
+from config import RAGConfig, APIConfig, CacheConfig
+from core.embedding_cache import EmbeddingCache
+from core.ratelimit import TokenBucket
+from utils.progress import ThrottledProgress
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 전역 임베딩 요청 속도 제한 (배치 워커 스레드와 세션 간 공유)
+_embedding_bucket = TokenBucket(
+    APIConfig.EMBEDDING_REQUESTS_PER_MINUTE,
+    APIConfig.EMBEDDING_REQUEST_BURST
+)
+
+_STORAGE_DTYPE = np.dtype(RAGConfig.EMBEDDING_STORAGE_DTYPE)
+
+# 프로세스 전역 쿼리 임베딩 LRU (키: EmbeddingCache.make_key, 값: 읽기 전용 float32 배열)
+_query_memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_query_memory_lock = threading.Lock()
+
+
+class _FaissHNSWIndex:
+    """FAISS IndexHNSWFlat을 hnswlib과 같은 `knn_query` 형태로 감싼 인덱스"""
+
+    def __init__(self, vectors: np.ndarray):
+        """
+        Args:
+            vectors: 정규화된 (N, D) float32 임베딩 행렬
+        """
+        self._index = faiss.IndexHNSWFlat(vectors.shape[1], RAGConfig.ANN_M, faiss.METRIC_INNER_PRODUCT)
+        self._index.hnsw.efConstruction = RAGConfig.ANN_EF_CONSTRUCTION
+        self._index.hnsw.efSearch = RAGConfig.ANN_EF_SEARCH
+        self._index.add(vectors)
+
+    def knn_query(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """상위 k개 이웃 검색
+
+        Returns:
+            (라벨 행렬, 거리 행렬) - hnswlib과 같은 순서
+        """
+        scores, labels = self._index.search(np.ascontiguousarray(queries, dtype=np.float32), k)
+        return labels, 1.0 - scores
+
 
 class SimpleVectorStore:
     """Gemini API를 사용한 간단한 벡터 스토어
@@ -30,86 +87,252 @@ class SimpleVectorStore:
         self.api_key = api_key
         genai.configure(api_key=api_key)
         self.chunks: List[str] = []
-        self.embeddings: List[List[float]] = []
+        # (청크 수, 차원) 행렬, 각 행은 L2 정규화되어 있음 (RAGConfig.EMBEDDING_STORAGE_DTYPE)
+        self.embedding_matrix = np.empty((0, RAGConfig.EMBEDDING_DIMENSION), dtype=_STORAGE_DTYPE)
+        self.embedding_cache = self._open_embedding_cache()
+        # 청크 수가 RAGConfig.ANN_THRESHOLD를 넘을 때만 생성되는 HNSW 인덱스
+        self._ann_index = None
+        # 임베딩 실패로 제로 벡터가 된 청크 수 (get_stats에서 행렬을 다시 훑지 않도록 유지)
+        self._zero_count = 0
+        # 의미 기반 검색 결과 캐시: (정규화된 쿼리 벡터, k, 결과 청크) 목록, 뒤쪽이 최근 사용
+        self._query_cache: List[Tuple[np.ndarray, int, List[str]]] = []
+        self._query_cache_lock = threading.Lock()
         logger.info("SimpleVectorStore 초기화 완료")
 
-    def add_texts(self, texts: List[str], batch_size: int = 1) -> None:
+    @staticmethod
+    def _open_embedding_cache() -> Optional[EmbeddingCache]:
+        """디스크 임베딩 캐시 열기 (비활성화 또는 실패 시 None)"""
+        if not CacheConfig.ENABLE_EMBEDDING_CACHE:
+            return None
+
+        try:
+            return EmbeddingCache()
+        except Exception as e:
+            logger.warning(f"임베딩 캐시를 사용할 수 없습니다: {e}")
+            return None
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        batch_size: int = APIConfig.EMBEDDING_BATCH_SIZE,
+        total: Optional[int] = None
+    ) -> None:
         """텍스트를 임베딩하여 저장
 
-        단일 텍스트씩 처리하여 API 배치 문제 회피
+        최대 batch_size개 텍스트를 한 번의 API 요청으로 임베딩하며,
+        배치 요청은 APIConfig.EMBEDDING_MAX_CONCURRENCY개까지 동시에 보냅니다.
 
         Args:
-            texts: 임베딩할 텍스트 리스트
-            batch_size: 배치 크기 (현재 1로 고정)
+            texts: 임베딩할 텍스트 (리스트 또는 제너레이터)
+            batch_size: 요청당 텍스트 수
+            total: 전체 텍스트 수 (제너레이터 전달 시 진행률 표시용)
         """
-        self.chunks = texts
-        total = len(texts)
-        logger.info(f"총 {total}개 텍스트 임베딩 시작")
-
-        progress_bar = st.progress(0)
+        if total is None:
+            texts = list(texts)
+            total = len(texts)
+        self.chunks = []
+        with self._query_cache_lock:
+            self._query_cache.clear()
+        logger.info(f"총 {total}개 텍스트 임베딩 시작 (배치 크기 {batch_size})")
+
+        progress_bar = ThrottledProgress(total)
         failed_count = 0
+        cached_count = 0
+        done = 0
+        # 배치 결과를 offset 위치에 바로 기록할 float32 행렬 (정규화 후 보관 정밀도로 변환)
+        matrix = np.zeros((total, RAGConfig.EMBEDDING_DIMENSION), dtype=np.float32)
+
+        # 배치를 동시에 최대 EMBEDDING_MAX_CONCURRENCY개까지 요청하고,
+        # 하나가 끝날 때마다 다음 배치를 제출 (제너레이터 입력도 필요한 만큼만 소비)
+        iterator = iter(texts)
+        pending = set()
+        with ThreadPoolExecutor(
+            max_workers=APIConfig.EMBEDDING_MAX_CONCURRENCY,
+            initializer=add_script_run_ctx,
+            initargs=(None, get_script_run_ctx())
+        ) as executor:
+            while True:
+                while len(pending) < APIConfig.EMBEDDING_MAX_CONCURRENCY:
+                    batch = list(islice(iterator, batch_size))
+                    if not batch:
+                        break
+                    offset = len(self.chunks)
+                    self.chunks.extend(batch)
+                    if len(self.chunks) > len(matrix):
+                        # total이 실제 청크 수보다 작게 전달된 경우
+                        matrix = np.resize(matrix, (len(self.chunks), matrix.shape[1]))
+                    pending.add(executor.submit(self._embed_batch, batch, offset))
+
+                if not pending:
+                    break
+
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    offset, batch_embeddings, batch_cached = future.result()
+                    rows = matrix[offset:offset + len(batch_embeddings)]
+                    rows[:] = batch_embeddings
+                    cached_count += batch_cached
+                    failed_count += int((~rows.any(axis=1)).sum())
+                    done += len(batch_embeddings)
+
+                progress_bar.update(done, text=f"임베딩 생성 중: {done}/{total}")
+
+        progress_bar.empty()
+        matrix = matrix[:len(self.chunks)]
+        total = len(self.chunks)
+
+        # 유사도 검색이 내적 한 번으로 끝나도록 삽입 시점에 정규화 (정규화는 float32로 수행)
+        self._normalize_rows(matrix, out=matrix)
+        self.embedding_matrix = matrix.astype(_STORAGE_DTYPE, copy=False)
+        self._ann_index = self._build_ann_index(matrix)
+        self._zero_count = failed_count
+
+        success_count = total - failed_count
+        logger.info(f"임베딩 완료: {success_count}/{total} 성공 (캐시 {cached_count}개)")
+
+        if failed_count > 0:
+            st.warning(f"⚠️ {failed_count}개 청크 임베딩 실패 (제로 벡터로 대체)")
+
+        st.success(f"✅ {success_count}개 청크 임베딩 완료!")
+
+    def _embed_batch(
+        self,
+        texts: List[str],
+        offset: int
+    ) -> Tuple[int, List[List[float]], int]:
+        """텍스트 배치 임베딩 (캐시 적중분은 API 요청에서 제외)
+
+        배치 요청이 실패하면 해당 배치만 단일 요청으로 재시도하여
+        청크 하나의 문제로 배치 전체가 제로 벡터가 되지 않도록 합니다.
+        워커 스레드에서 실행되며, Rate Limit 대기는 요청 직전 공유 토큰 버킷에서 합니다.
+
+        Args:
+            texts: 임베딩할 텍스트 배치
+            offset: 배치 첫 텍스트의 전체 인덱스
+
+        Returns:
+            (offset, 임베딩 리스트, 캐시 적중 수)
+        """
+        keys: List[Optional[str]] = [None] * len(texts)
+        cached = {}
+        if self.embedding_cache:
+            keys = [
+                EmbeddingCache.make_key(
+                    text,
+                    RAGConfig.EMBEDDING_MODEL,
+                    RAGConfig.EMBEDDING_TASK_TYPE_DOC
+                )
+                for text in texts
+            ]
+            cached = self.embedding_cache.get_many(keys)
+
+        results: List[Optional[List[float]]] = [cached.get(key) if key else None for key in keys]
+        missing = [i for i, emb in enumerate(results) if emb is None]
+
+        if not missing:
+            return offset, results, len(texts)
+
+        try:
+            response = self._request_embeddings([texts[i] for i in missing])
+            vectors = self._extract_embeddings(response, len(missing))
+
+        except Exception as e:
+            logger.warning(f"청크 {offset + 1}~{offset + len(texts)} 배치 임베딩 실패, 단일 요청으로 재시도: {e}")
+            vectors = [self._embed_single(texts[i], offset + i + 1) for i in missing]
 
-        for i, text in enumerate(texts, 1):
+        for i, vector in zip(missing, vectors):
+            results[i] = vector
+
+        if self.embedding_cache:
+            self.embedding_cache.set_many({
+                keys[i]: results[i] for i in missing if any(results[i])
+            })
+
+        return offset, results, len(texts) - len(missing)
+
+    @staticmethod
+    def _request_embeddings(content: List[str]):
+        """문서 임베딩 요청 (429 응답 시 Retry-After 또는 지터를 더한 지수 백오프 후 재시도)
+
+        요청 전 공유 토큰 버킷에서 토큰을 얻고, 429 응답을 받으면 대기 시간 동안
+        다른 스레드의 요청도 함께 멈춥니다.
+
+        Args:
+            content: 임베딩할 텍스트 리스트
+
+        Returns:
+            API 응답
+        """
+        for attempt in range(APIConfig.MAX_RETRIES + 1):
+            _embedding_bucket.acquire()
             try:
-                # 단일 텍스트씩 임베딩 생성
-                result = genai.embed_content(
+                return genai.embed_content(
                     model=RAGConfig.EMBEDDING_MODEL,
-                    content=text,
+                    content=content,
                     task_type=RAGConfig.EMBEDDING_TASK_TYPE_DOC
                 )
 
-                # 응답 처리
-                embedding = self._extract_embedding(result, i)
-                self.embeddings.append(embedding)
+            except google_exceptions.TooManyRequests as e:
+                if attempt == APIConfig.MAX_RETRIES:
+                    raise
+                delay = SimpleVectorStore._retry_after(e)
+                if delay is None:
+                    # 동시에 실패한 워커들이 같은 시점에 몰려 재시도하지 않도록 지터 추가
+                    delay = APIConfig.RETRY_DELAY * (2 ** attempt) + random.uniform(0, APIConfig.RETRY_DELAY)
+                logger.warning(f"임베딩 요청 한도 초과, {delay:.1f}초 후 재시도 ({attempt + 1}/{APIConfig.MAX_RETRIES})")
+                _embedding_bucket.penalize(delay)
 
-                # 진행 상황 업데이트
-                progress = i / total
-                progress_bar.progress(
-                    progress,
-                    text=f"임베딩 생성 중: {i}/{total}"
-                )
-
-                # Rate Limiting
-                if i % APIConfig.RATE_LIMIT_BATCH_SIZE == 0:
-                    time.sleep(APIConfig.RATE_LIMIT_BATCH_DELAY)
-                else:
-                    time.sleep(APIConfig.RATE_LIMIT_DELAY)
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """429 응답의 Retry-After 헤더 값 (초), 없으면 None"""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None) or {}
+        try:
+            return float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
 
-            except Exception as e:
-                logger.error(f"청크 {i} 임베딩 실패: {e}")
-                st.warning(f"청크 {i} 임베딩 실패: {e}")
-                # 실패한 청크는 제로 벡터로 대체
-                self.embeddings.append([0.0] * RAGConfig.EMBEDDING_DIMENSION)
-                failed_count += 1
+    def _embed_single(self, text: str, chunk_index: int) -> List[float]:
+        """단일 텍스트 임베딩 (실패 시 제로 벡터)
 
-        progress_bar.empty()
+        Args:
+            text: 임베딩할 텍스트
+            chunk_index: 청크 번호 (로깅용)
 
-        success_count = total - failed_count
-        logger.info(f"임베딩 완료: {success_count}/{total} 성공")
+        Returns:
+            임베딩 벡터
+        """
+        try:
+            result = self._request_embeddings([text])
+            return self._extract_embeddings(result, 1)[0]
 
-        if failed_count > 0:
-            st.warning(f"⚠️ {failed_count}개 청크 임베딩 실패 (제로 벡터로 대체)")
+        except Exception as e:
+            logger.error(f"청크 {chunk_index} 임베딩 실패: {e}")
+            st.warning(f"청크 {chunk_index} 임베딩 실패: {e}")
+            # 실패한 청크는 제로 벡터로 대체
+            return [0.0] * RAGConfig.EMBEDDING_DIMENSION
 
-        st.success(f"✅ {success_count}개 청크 임베딩 완료!")
+    @staticmethod
+    def _extract_embeddings(result: any, expected: int) -> List[List[float]]:
+        """API 응답에서 임베딩 리스트 추출
 
-    def _extract_embedding(self, result: any, chunk_index: int) -> List[float]:
-        """API 응답에서 임베딩 추출
+        모든 임베딩 요청은 텍스트 리스트로 보내므로 응답은 항상
+        `{'embedding': [[...], ...]}` 형태입니다.
 
         Args:
             result: API 응답
-            chunk_index: 청크 인덱스 (로깅용)
+            expected: 요청한 텍스트 수
 
         Returns:
-            임베딩 벡터
+            임베딩 벡터 리스트
+
+        Raises:
+            ValueError: 응답 구조나 개수가 예상과 다른 경우
         """
-        if isinstance(result, dict) and 'embedding' in result:
-            return result['embedding']
-        elif isinstance(result, list):
-            return result
-        else:
-            logger.warning(f"청크 {chunk_index}: 예상치 못한 응답 구조 - {type(result)}")
-            st.warning(f"청크 {chunk_index}: 예상치 못한 응답 구조")
-            return [0.0] * RAGConfig.EMBEDDING_DIMENSION
+        embeddings = result.get('embedding') if isinstance(result, dict) else None
+        if not isinstance(embeddings, list) or len(embeddings) != expected:
+            raise ValueError(f"예상치 못한 임베딩 응답 구조: {type(result)}")
+        return embeddings
 
     def similarity_search(
         self,
@@ -125,36 +348,20 @@ class SimpleVectorStore:
         Returns:
             유사도가 높은 청크 리스트
         """
-        if not self.embeddings:
+        if not self.embedding_matrix.size:
             logger.warning("임베딩이 비어있어 검색 불가")
             return []
 
         try:
-            # 쿼리 임베딩 생성
-            result = genai.embed_content(
-                model=RAGConfig.EMBEDDING_MODEL,
-                content=query,
-                task_type=RAGConfig.EMBEDDING_TASK_TYPE_QUERY
-            )
-
-            # 쿼리 임베딩 추출
-            query_embedding = self._extract_query_embedding(result)
-            if not query_embedding:
+            # 쿼리 임베딩 생성 (캐시 우선)
+            query_embedding = self._embed_queries([query])[0]
+            if query_embedding is None:
                 logger.warning("쿼리 임베딩 생성 실패, 앞부분 반환")
                 return self.chunks[:k]
 
-            # 코사인 유사도 계산
-            similarities = []
-            for idx, doc_embedding in enumerate(self.embeddings):
-                similarity = self._cosine_similarity(query_embedding, doc_embedding)
-                similarities.append((idx, similarity))
-
-            # 상위 k개 선택
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            top_k = similarities[:k]
-
+            top_k = self._rank_chunks(query_embedding, k)
             logger.info(f"검색 완료: 상위 {len(top_k)}개 청크 반환")
-            return [self.chunks[idx] for idx, _ in top_k]
+            return top_k
 
         except Exception as e:
             logger.error(f"검색 중 오류: {e}")
@@ -162,50 +369,367 @@ class SimpleVectorStore:
             # 실패 시 앞부분 반환
             return self.chunks[:k]
 
-    def _extract_query_embedding(self, result: any) -> Optional[List[float]]:
-        """쿼리 API 응답에서 임베딩 추출
+    def similarity_search_batch(
+        self,
+        queries: List[str],
+        k: int = RAGConfig.DEFAULT_K_SEARCH
+    ) -> List[List[str]]:
+        """여러 쿼리를 한 번의 임베딩 요청으로 검색
 
         Args:
-            result: API 응답
+            queries: 검색 쿼리 리스트
+            k: 쿼리별 반환할 상위 결과 수
+
+        Returns:
+            쿼리 순서대로 유사도가 높은 청크 리스트
+        """
+        fallback = [self.chunks[:k] for _ in queries]
+
+        if not self.embedding_matrix.size:
+            logger.warning("임베딩이 비어있어 검색 불가")
+            return [[] for _ in queries]
+
+        try:
+            # 쿼리 임베딩 일괄 생성 (캐시 우선)
+            query_embeddings = self._embed_queries(queries)
+            if any(embedding is None for embedding in query_embeddings):
+                logger.warning("일괄 쿼리 임베딩 생성 실패, 앞부분 반환")
+                return fallback
+
+            results = self._rank_chunks_batch(query_embeddings, k)
+            logger.info(f"일괄 검색 완료: {len(queries)}개 쿼리, 쿼리당 상위 {k}개 청크")
+            return results
+
+        except Exception as e:
+            logger.error(f"일괄 검색 중 오류: {e}")
+            st.warning(f"검색 중 오류: {e}")
+            return fallback
+
+    def _embed_queries(self, queries: List[str]) -> List[Optional[np.ndarray]]:
+        """쿼리 임베딩 조회 (메모리 → 디스크 캐시 → API 순)
+
+        심사 쿼리는 문서가 바뀌어도 동일하므로, 캐시에 없는 쿼리만
+        한 번의 요청으로 임베딩합니다.
+
+        Args:
+            queries: 검색 쿼리 리스트
+
+        Returns:
+            쿼리 순서대로 정규화된 읽기 전용 float32 임베딩 벡터 (실패 시 None)
+        """
+        keys = [
+            EmbeddingCache.make_key(
+                query,
+                RAGConfig.EMBEDDING_MODEL,
+                RAGConfig.EMBEDDING_TASK_TYPE_QUERY
+            )
+            for query in queries
+        ]
+
+        with _query_memory_lock:
+            results = [_query_memory.get(key) for key in keys]
+
+        missing = [i for i, emb in enumerate(results) if emb is None]
+        if missing and self.embedding_cache:
+            stored = self.embedding_cache.get_many(keys[i] for i in missing)
+            for i in missing:
+                results[i] = stored.get(keys[i])
+            missing = [i for i in missing if results[i] is None]
+
+        if missing:
+            _embedding_bucket.acquire()
+            result = genai.embed_content(
+                model=RAGConfig.EMBEDDING_MODEL,
+                content=[queries[i] for i in missing],
+                task_type=RAGConfig.EMBEDDING_TASK_TYPE_QUERY
+            )
+            try:
+                embeddings = self._extract_embeddings(result, len(missing))
+            except ValueError as e:
+                logger.warning(str(e))
+                return results
+
+            for i, embedding in zip(missing, embeddings):
+                results[i] = embedding
+            if self.embedding_cache:
+                self.embedding_cache.set_many({keys[i]: results[i] for i in missing})
+
+        # 변환/정규화는 캐시에 넣을 때 한 번만 수행하고,
+        # 메모리 캐시와 호출자가 같은 배열을 공유하므로 읽기 전용으로 고정
+        results = [self._frozen_query(embedding) for embedding in results]
+        with _query_memory_lock:
+            for key, embedding in zip(keys, results):
+                _query_memory[key] = embedding
+                _query_memory.move_to_end(key)
+            while len(_query_memory) > CacheConfig.QUERY_EMBEDDING_MEMORY_SIZE:
+                _query_memory.popitem(last=False)
+
+        return results
+
+    def _rank_chunks(self, query_embedding: List[float], k: int) -> List[str]:
+        """쿼리 임베딩과 코사인 유사도가 높은 상위 k개 청크 반환
+
+        Args:
+            query_embedding: 쿼리 임베딩 벡터
+            k: 반환할 상위 결과 수
+
+        Returns:
+            유사도 순으로 정렬된 청크 리스트
+        """
+        return self._rank_chunks_batch([query_embedding], k)[0]
+
+    def _rank_chunks_batch(self, query_embeddings: List[List[float]], k: int) -> List[List[str]]:
+        """여러 쿼리 임베딩 각각에 대해 코사인 유사도 상위 k개 청크 반환
+
+        문서 행렬이 정규화되어 있으므로 정규화된 쿼리 행렬과의 행렬곱 한 번으로
+        모든 쿼리-청크 쌍의 코사인 유사도를 계산합니다. 의미상 거의 같은 쿼리가
+        이전에 검색된 경우에는 그 결과를 재사용하고, HNSW 인덱스가 있으면
+        근사 검색을 우선 사용합니다 (실패 시 전수 검색).
+
+        Args:
+            query_embeddings: 쿼리 임베딩 벡터 리스트
+            k: 쿼리별 반환할 상위 결과 수
+
+        Returns:
+            쿼리 순서대로 유사도 순으로 정렬된 청크 리스트
+        """
+        # 쿼리 행렬을 한 번만 할당하고 그 자리에서 정규화 (이미 정규화된 벡터는 그대로)
+        queries = np.array(query_embeddings, dtype=np.float32)
+        self._normalize_rows(queries, out=queries)
+        results: List[Optional[List[str]]] = [self._lookup_query_cache(query, k) for query in queries]
+        pending = [i for i, result in enumerate(results) if result is None]
+        computed = list(pending)
+
+        if pending and self._ann_index is not None:
+            try:
+                labels, _ = self._ann_index.knn_query(queries[pending], k=min(k, len(self.chunks)))
+                # FAISS는 이웃이 k개보다 적으면 라벨 -1로 채우므로 해당 쿼리는 전수 검색으로 처리
+                incomplete = []
+                for i, row in zip(pending, labels):
+                    if (row < 0).any():
+                        incomplete.append(i)
+                    else:
+                        results[i] = [self.chunks[idx] for idx in row]
+                pending = incomplete
+            except Exception as e:
+                logger.warning(f"HNSW 검색 실패, 전수 검색으로 대체: {e}")
+
+        if pending:
+            scores = self._scan(queries[pending])
+            for column, i in enumerate(pending):
+                top_idx = self._top_k_indices(scores[:, column], k)
+                results[i] = [self.chunks[idx] for idx in top_idx]
+
+        for i in computed:
+            self._store_query_cache(queries[i], k, results[i])
+
+        return results
+
+    def _scan(self, queries: np.ndarray) -> np.ndarray:
+        """모든 청크와 쿼리들의 내적 점수 계산
+
+        NumPy는 float16 행렬곱에 BLAS를 쓰지 않으므로 float32로 변환해 계산하되,
+        행렬 전체를 한 번에 복사하지 않고 캐시에 들어가는 행 블록 단위로 변환합니다.
+
+        Args:
+            queries: (M, D) 정규화된 float32 쿼리 행렬
+
+        Returns:
+            (N, M) 점수 행렬
+        """
+        matrix = self.embedding_matrix
+        if matrix.dtype == np.float32:
+            return matrix @ queries.T
+
+        scores = np.empty((len(matrix), len(queries)), dtype=np.float32)
+        block = RAGConfig.SCAN_BLOCK_ROWS
+        for start in range(0, len(matrix), block):
+            np.matmul(
+                matrix[start:start + block].astype(np.float32),
+                queries.T,
+                out=scores[start:start + block]
+            )
+        return scores
+
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+        """점수 상위 k개 인덱스 (내림차순)
+
+        전체 정렬 대신 argpartition으로 상위 k개만 고른 뒤 그 k개만 정렬합니다.
+
+        Args:
+            scores: 청크별 유사도 점수
+            k: 반환할 개수
 
         Returns:
-            임베딩 벡터 또는 None
+            점수 내림차순 인덱스 배열
         """
-        if isinstance(result, dict) and 'embedding' in result:
-            return result['embedding']
-        elif isinstance(result, list):
-            return result
-        else:
-            logger.warning(f"예상치 못한 쿼리 응답 구조: {type(result)}")
+        if k >= len(scores):
+            return np.argsort(-scores, kind='stable')
+
+        top_idx = np.argpartition(-scores, k)[:k]
+        return top_idx[np.argsort(-scores[top_idx], kind='stable')]
+
+    @staticmethod
+    def _build_ann_index(matrix: np.ndarray):
+        """청크 수가 임계값을 넘으면 내적 기반 HNSW 인덱스 생성
+
+        hnswlib을 우선 사용하고, 없으면 FAISS의 IndexHNSWFlat을 사용합니다.
+
+        Args:
+            matrix: 정규화된 임베딩 행렬
+
+        Returns:
+            `knn_query`를 제공하는 인덱스 또는 None (라이브러리 미설치, 임계값 이하, 생성 실패 시)
+        """
+        if (hnswlib is None and faiss is None) or len(matrix) <= RAGConfig.ANN_THRESHOLD:
             return None
 
+        try:
+            vectors = np.ascontiguousarray(matrix, dtype=np.float32)
+            if hnswlib is not None:
+                index = hnswlib.Index(space='ip', dim=matrix.shape[1])
+                index.init_index(
+                    max_elements=len(matrix),
+                    M=RAGConfig.ANN_M,
+                    ef_construction=RAGConfig.ANN_EF_CONSTRUCTION
+                )
+                index.add_items(vectors, np.arange(len(matrix)))
+                index.set_ef(RAGConfig.ANN_EF_SEARCH)
+            else:
+                index = _FaissHNSWIndex(vectors)
+            logger.info(f"HNSW 인덱스 생성 완료: {len(matrix)}개 청크 ({type(index).__name__})")
+            return index
+
+        except Exception as e:
+            logger.warning(f"HNSW 인덱스 생성 실패, 전수 검색 사용: {e}")
+            return None
+
+    def _store_query_cache(self, query: np.ndarray, k: int, top_k: List[str]) -> None:
+        """검색 결과를 의미 기반 캐시에 저장 (가장 오래된 항목부터 제거)"""
+        with self._query_cache_lock:
+            self._query_cache.append((query, k, top_k))
+            if len(self._query_cache) > CacheConfig.SEMANTIC_QUERY_CACHE_SIZE:
+                self._query_cache.pop(0)
+
+    def _lookup_query_cache(self, query: np.ndarray, k: int) -> Optional[List[str]]:
+        """의미상 거의 같은 이전 쿼리의 검색 결과 조회
+
+        캐시된 쿼리 벡터도 정규화되어 있으므로 내적이 곧 코사인 유사도입니다.
+
+        Args:
+            query: 정규화된 쿼리 벡터
+            k: 반환할 상위 결과 수
+
+        Returns:
+            유사도가 RAGConfig.SEMANTIC_CACHE_THRESHOLD 이상인 이전 결과 또는 None
+        """
+        with self._query_cache_lock:
+            candidates = [i for i, (_, cached_k, _) in enumerate(self._query_cache) if cached_k == k]
+            if not candidates:
+                return None
+
+            vectors = np.stack([self._query_cache[i][0] for i in candidates])
+            similarities = vectors @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < RAGConfig.SEMANTIC_CACHE_THRESHOLD:
+                return None
+
+            entry = self._query_cache.pop(candidates[best])
+            self._query_cache.append(entry)
+
+        logger.info(f"검색 결과 캐시 적중 (유사도 {similarities[best]:.3f})")
+        return entry[2]
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """행 단위 L2 정규화 (제로 벡터는 그대로 유지)
+
+        Args:
+            matrix: (N, D) 행렬
+            out: 결과를 기록할 배열 (matrix를 넘기면 제자리 정규화)
+
+        Returns:
+            정규화된 행렬
+        """
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, np.clip(norms, 1e-12, None), out=out)
+
     @staticmethod
-    def _cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
-        """코사인 유사도 계산
+    def _frozen_query(vec) -> np.ndarray:
+        """정규화된 읽기 전용 float32 쿼리 벡터로 변환 (이미 변환된 배열은 그대로 반환)"""
+        if isinstance(vec, np.ndarray) and vec.dtype == np.float32 and not vec.flags.writeable:
+            return vec
+        array = np.array(vec, dtype=np.float32)
+        array /= max(float(np.linalg.norm(array)), 1e-12)
+        array.flags.writeable = False
+        return array
+
+    def save(self, path: Path) -> bool:
+        """정규화된 임베딩 행렬(.npy)과 청크(.json)를 디렉토리에 저장
 
         Args:
-            vec1: 첫 번째 벡터
-            vec2: 두 번째 벡터
+            path: 저장할 디렉토리
 
         Returns:
-            코사인 유사도 (0-1)
+            저장 성공 여부
         """
         try:
-            vec1_np = np.array(vec1)
-            vec2_np = np.array(vec2)
+            path = Path(path)
+            path.mkdir(parents=True, exist_ok=True)
+
+            # 임시 파일에 쓴 뒤 교체하여 다른 프로세스가 쓰다 만 파일을 읽지 않도록 함
+            tmp_matrix = path / "embeddings.tmp.npy"
+            tmp_chunks = path / "chunks.tmp.json"
+            np.save(tmp_matrix, self.embedding_matrix)
+            tmp_chunks.write_text(json.dumps(self.chunks, ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp_matrix, path / "embeddings.npy")
+            os.replace(tmp_chunks, path / "chunks.json")
 
-            # 제로 벡터 체크
-            norm1 = np.linalg.norm(vec1_np)
-            norm2 = np.linalg.norm(vec2_np)
+            logger.info(f"벡터 스토어 저장 완료: {path}")
+            return True
 
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
+        except Exception as e:
+            logger.warning(f"벡터 스토어 저장 실패: {e}")
+            return False
+
+    @classmethod
+    def load(cls, api_key: str, path: Path) -> Optional['SimpleVectorStore']:
+        """save()로 저장한 벡터 스토어 로드
+
+        임베딩 행렬은 읽기 전용 mmap으로 열어 역직렬화 없이 OS 페이지 캐시에서 읽습니다.
+
+        Args:
+            api_key: Gemini API 키
+            path: 저장된 디렉토리
 
-            return float(np.dot(vec1_np, vec2_np) / (norm1 * norm2))
+        Returns:
+            벡터 스토어 또는 None (없거나 손상된 경우)
+        """
+        path = Path(path)
+        matrix_path = path / "embeddings.npy"
+        chunks_path = path / "chunks.json"
+        if not matrix_path.exists() or not chunks_path.exists():
+            return None
+
+        try:
+            matrix = np.load(matrix_path, mmap_mode='r')
+            chunks = json.loads(chunks_path.read_text(encoding='utf-8'))
+            if matrix.shape != (len(chunks), RAGConfig.EMBEDDING_DIMENSION):
+                logger.warning(f"저장된 벡터 스토어 형식 불일치: {path}")
+                return None
+
+            vector_store = cls(api_key)
+            vector_store.chunks = chunks
+            vector_store.embedding_matrix = matrix
+            vector_store._zero_count = int((~matrix.any(axis=1)).sum())
+            vector_store._ann_index = cls._build_ann_index(matrix)
+            logger.info(f"벡터 스토어 로드 완료: {path} ({len(chunks)}개 청크)")
+            return vector_store
 
         except Exception as e:
-            logger.error(f"코사인 유사도 계산 오류: {e}")
-            return 0.0
+            logger.warning(f"벡터 스토어 로드 실패: {e}")
+            return None
 
     def get_stats(self) -> dict:
         """벡터 스토어 통계 정보 반환
@@ -215,7 +739,10 @@ class SimpleVectorStore:
         """
         return {
             "total_chunks": len(self.chunks),
-            "total_embeddings": len(self.embeddings),
+            "total_embeddings": len(self.embedding_matrix),
             "embedding_dimension": RAGConfig.EMBEDDING_DIMENSION,
-            "zero_vectors": sum(1 for emb in self.embeddings if all(v == 0.0 for v in emb))
+            "zero_vectors": self._zero_count,
+            "storage_dtype": str(self.embedding_matrix.dtype),
+            "ann_index": self._ann_index is not None,
+            "memory_bytes": self.embedding_matrix.nbytes
         }
@@ -4,20 +4,21 @@
 사용법: python generate_admin_password_hash.py
 """
 
-import hashlib
 import getpass
 
+from utils.security import hash_password
+
 
 def generate_password_hash(password: str) -> str:
-    """비밀번호 해시 생성 (SHA-256)
+    """비밀번호 해시 생성 (scrypt)
 
     Args:
         password: 원본 비밀번호
 
     Returns:
-        SHA-256 해시 문자열
+        `scrypt$N$r$p$salt$hash` 형식의 해시 문자열
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    return hash_password(password)
 
 
 def main():
@@ -5,9 +5,9 @@ KOICA 사업 예비조사 심사 시스템 - Streamlit Web App
 """
 
 import os
+import gc
 import logging
-from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 import streamlit as st
 
 # 로깅 설정 (다른 import보다 먼저)
@@ -20,15 +20,17 @@ analytics = get_analytics()
 
 # 내부 모듈 import
 from core.auditor import KOICAAuditorStreamlit
+from core.batch import (
+    BatchAuditClient, BATCH_API_AVAILABLE, POLICY_KEY, IMPLEMENTATION_KEY, TERMINAL_STATES
+)
 from ui.components import (
     display_results,
-    generate_report_text,
+    generate_reports,
     generate_report_json,
-    generate_report_csv,
     get_custom_css
 )
 from config import (
-    AppConfig, FileConfig, UIConfig, CacheConfig
+    AppConfig, APIConfig, AuditConfig, FileConfig, UIConfig, CacheConfig
 )
 
 # 페이지 설정 (최상위에서 한 번만 호출)
@@ -40,14 +42,16 @@ st.set_page_config(
 )
 
 
-def load_api_key() -> Optional[str]:
-    """API 키 로드
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def _read_api_key() -> str:
+    """설정된 API 키 조회 (찾으면 하루 동안 캐시)
 
     Returns:
-        API 키 또는 None
-    """
-    api_key = None
+        API 키
 
+    Raises:
+        KeyError: 어디에도 API 키가 없는 경우 (예외는 캐시되지 않으므로 설정 후 바로 반영)
+    """
     # 1. Streamlit secrets에서 로드 시도 (우선순위 1)
     try:
         api_key = st.secrets["GEMINI_API_KEY"]
@@ -57,15 +61,81 @@ def load_api_key() -> Optional[str]:
         logger.debug("Streamlit secrets에 API 키가 없습니다.")
 
     # 2. 환경변수에서 로드 시도 (우선순위 2)
+    api_key = os.getenv("GEMINI_API_KEY")
+    if api_key:
+        logger.info("API 키를 환경변수에서 로드했습니다.")
+        return api_key
+
+    raise KeyError("GEMINI_API_KEY")
+
+
+def load_api_key() -> Optional[str]:
+    """API 키 로드
+
+    Returns:
+        API 키 또는 None
+    """
     try:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if api_key:
-            logger.info("API 키를 환경변수에서 로드했습니다.")
-            return api_key
+        return _read_api_key()
+    except KeyError:
+        return None
     except Exception as e:
-        logger.error(f"환경변수 로드 중 오류: {e}")
+        logger.error("API 키 로드 중 오류: %s", e)
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def get_auditor(api_key: str, model_name: str = APIConfig.GENERATIVE_MODEL) -> KOICAAuditorStreamlit:
+    """(API 키, 모델)별로 한 번만 생성한 심사 시스템 인스턴스 반환
+
+    재실행마다 genai 설정과 모델 객체를 다시 만들지 않도록 프로세스 단위로 캐시합니다.
+    인스턴스에는 세션별 상태가 없으므로 여러 세션이 공유해도 안전합니다.
+
+    Args:
+        api_key: Gemini API 키
+        model_name: 분석 모델명
 
-    return None
+    Returns:
+        심사 시스템 인스턴스
+    """
+    return KOICAAuditorStreamlit(api_key=api_key, model_name=model_name)
+
+
+def get_reports(session_key: str, results: Dict) -> Dict[str, str]:
+    """세션에 저장된 심사 결과의 다운로드용 보고서 (TXT/JSON/CSV) 반환
+
+    재실행마다 보고서를 다시 만들지 않도록 결과 객체와 함께 세션에 보관하고,
+    새 분석으로 결과 객체가 바뀐 경우에만 다시 생성합니다.
+
+    Args:
+        session_key: 심사 결과가 저장된 세션 상태 키
+        results: 세션에서 조회한 심사 결과
+
+    Returns:
+        형식("text", "json", "csv")별 보고서 문자열과 파일명용 생성 시각("timestamp")
+    """
+    cache_key = f"{session_key}_reports"
+    cached = st.session_state.get(cache_key)
+
+    if cached is None or cached[0] is not results:
+        # 파일명 시각은 결과당 한 번만 정해 재실행마다 바뀌지 않도록 함
+        cached = (results, generate_reports(results))
+        st.session_state[cache_key] = cached
+
+    return cached[1]
+
+
+def clear_results(session_key: str) -> None:
+    """세션에 저장된 심사 결과와 보고서를 삭제하고 메모리 회수
+
+    Args:
+        session_key: 심사 결과가 저장된 세션 상태 키
+    """
+    removed = st.session_state.pop(session_key, None)
+    st.session_state.pop(f"{session_key}_reports", None)
+    if removed is not None:
+        del removed
+        gc.collect()
 
 
 def validate_file_size(uploaded_file) -> bool:
@@ -81,24 +151,39 @@ def validate_file_size(uploaded_file) -> bool:
         return False
 
     file_size = uploaded_file.size
-    logger.info(f"업로드 파일 크기: {file_size / (1024*1024):.2f} MB")
 
+    # 한도 비교를 먼저 하고, 로그 문자열은 필요한 경우에만 만듦
     if file_size > FileConfig.MAX_FILE_SIZE:
         error_msg = UIConfig.MSG_FILE_TOO_LARGE.format(FileConfig.MAX_FILE_SIZE_MB)
         st.error(f"❌ {error_msg}")
-        logger.warning(f"파일 크기 초과: {file_size} bytes (최대: {FileConfig.MAX_FILE_SIZE})")
+        logger.warning("파일 크기 초과: %d bytes (최대: %d)", file_size, FileConfig.MAX_FILE_SIZE)
         return False
 
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("업로드 파일 크기: %.2f MB", file_size / (1024 * 1024))
     return True
 
 
-def render_sidebar():
-    """사이드바 렌더링"""
+def render_sidebar() -> str:
+    """사이드바 렌더링
+
+    Returns:
+        선택된 분석 모델명
+    """
     with st.sidebar:
         st.markdown(f"## 📊 도구 정보 (v{AppConfig.APP_VERSION})")
         st.warning("**비공식 개인 프로젝트**")
         st.markdown("---")
 
+        # 분석 품질 (모델) 선택
+        quality = st.radio(
+            "품질",
+            list(APIConfig.MODEL_TIERS),
+            help="빠름: 응답이 빠르고 비용이 낮습니다. 정확: 더 정밀하지만 느립니다.",
+            key="model_tier"
+        )
+        st.markdown("---")
+
         # 익명 모니터링 안내
         st.markdown("### 🔒 개인정보 보호")
         st.info("""
@@ -123,11 +208,13 @@ def render_sidebar():
         st.markdown("### 📝 이전 버전 개선사항")
         st.success("""
         - **안정적인 임베딩**: Gemini API 직접 사용
-        - **배치 문제 해결**: 단일 텍스트씩 처리
+        - **배치 임베딩**: 최대 100개 청크를 한 번에 요청
         - **오류 복구**: 실패 시 자동 대체
         - **진행 상황 표시**: 실시간 프로그레스바
         """)
 
+    return APIConfig.MODEL_TIERS[quality]
+
 
 def render_disclaimer():
     """면책 조항 렌더링"""
@@ -184,6 +271,65 @@ def render_privacy_notice():
     )
 
 
+def render_results(session_key: str, key_prefix: str):
+    """세션에 저장된 심사 결과와 다운로드/지우기 버튼 렌더링 (PDF·텍스트 탭 공용)
+
+    Args:
+        session_key: 심사 결과가 저장된 세션 상태 키
+        key_prefix: 위젯 키 접두어 (탭별로 달라야 함)
+    """
+    results = st.session_state.get(session_key)
+    if results is None:
+        return
+
+    display_results(results)
+    reports = get_reports(session_key, results)
+
+    # 다운로드 버튼 3개 (TXT, JSON, CSV)
+    st.markdown("### 📥 심사 결과 다운로드")
+    col1, col2, col3 = st.columns(3)
+
+    timestamp = reports["timestamp"]
+
+    with col1:
+        st.download_button(
+            label="📄 텍스트 (TXT)",
+            data=reports["text"],
+            file_name=f"KOICA_심사결과_{timestamp}.txt",
+            mime="text/plain",
+            key=f"download_{key_prefix}_txt",
+            help="사람이 읽기 쉬운 텍스트 형식"
+        )
+
+    with col2:
+        st.download_button(
+            label="💾 JSON",
+            data=reports["json"],
+            file_name=f"KOICA_심사결과_{timestamp}.json",
+            mime="application/json",
+            key=f"download_{key_prefix}_json",
+            help="데이터베이스 저장에 적합한 JSON 형식"
+        )
+
+    with col3:
+        st.download_button(
+            label="📊 CSV",
+            data=reports["csv"],
+            file_name=f"KOICA_심사결과_{timestamp}.csv",
+            mime="text/csv",
+            key=f"download_{key_prefix}_csv",
+            help="엑셀/스프레드시트에서 열어볼 수 있는 CSV 형식"
+        )
+
+    st.button(
+        "🗑️ 결과 지우기",
+        key=f"clear_{key_prefix}_results",
+        on_click=clear_results,
+        args=(session_key,)
+    )
+
+
+@st.fragment
 def render_pdf_tab(auditor: KOICAAuditorStreamlit):
     """PDF 분석 탭 렌더링
 
@@ -195,7 +341,9 @@ def render_pdf_tab(auditor: KOICAAuditorStreamlit):
     uploaded_file = st.file_uploader(
         "KOICA 예비조사 보고서 (PDF)",
         type=FileConfig.SUPPORTED_FILE_TYPES,
-        key="pdf_uploader"
+        key="pdf_uploader",
+        on_change=clear_results,  # 다른 파일을 올리면 이전 결과 해제
+        args=(CacheConfig.SESSION_PDF_RESULTS,)
     )
 
     if uploaded_file:
@@ -206,10 +354,12 @@ def render_pdf_tab(auditor: KOICAAuditorStreamlit):
             return
 
         if st.button("🚀 분석 시작 (RAG v3.1)", type="primary", key="analyze_pdf"):
-            logger.info(f"PDF 분석 시작: {uploaded_file.name}")
+            logger.info("PDF 분석 시작: %s", uploaded_file.name)
+            # 새 분석 전에 이전 결과를 먼저 해제 (세션당 최신 결과 하나만 유지)
+            clear_results(CacheConfig.SESSION_PDF_RESULTS)
 
             # 익명 분석 활동 로깅 (파일 이름은 저장하지 않음)
-            analytics.log_activity(
+            analytics.log_activity_async(
                 st.session_state.analytics_session_id,
                 action_type="pdf_analysis_started",
                 file_size_bytes=uploaded_file.size
@@ -217,14 +367,15 @@ def render_pdf_tab(auditor: KOICAAuditorStreamlit):
 
             try:
                 # 1. 텍스트 추출
-                full_text = auditor.extract_text_from_pdf(uploaded_file)
-                st.session_state[CacheConfig.SESSION_PDF_TEXT] = full_text
+                doc_hash = auditor.hash_pdf_file(uploaded_file)
+                st.session_state[CacheConfig.SESSION_DOC_HASH] = doc_hash
+                full_text = auditor.extract_text_from_pdf(uploaded_file, doc_hash=doc_hash)
 
                 if not full_text:
                     st.error("❌ PDF에서 텍스트를 추출하지 못했습니다.")
                     logger.error("PDF 텍스트 추출 실패")
                     # 실패 로깅
-                    analytics.log_activity(
+                    analytics.log_activity_async(
                         st.session_state.analytics_session_id,
                         action_type="pdf_analysis",
                         file_size_bytes=uploaded_file.size,
@@ -233,16 +384,16 @@ def render_pdf_tab(auditor: KOICAAuditorStreamlit):
                     )
                     return
 
-                logger.info(f"PDF 텍스트 추출 완료: {len(full_text)} 문자")
+                logger.info("PDF 텍스트 추출 완료: %d 문자", len(full_text))
 
                 # 2. 분석 수행
-                results = auditor.conduct_audit(full_text=full_text)
+                results = auditor.conduct_audit(full_text=full_text, doc_hash=doc_hash)
 
                 if results:
                     st.session_state[CacheConfig.SESSION_PDF_RESULTS] = results
                     logger.info("PDF 분석 완료")
                     # 성공 로깅
-                    analytics.log_activity(
+                    analytics.log_activity_async(
                         st.session_state.analytics_session_id,
                         action_type="pdf_analysis",
                         file_size_bytes=uploaded_file.size,
@@ -252,7 +403,7 @@ def render_pdf_tab(auditor: KOICAAuditorStreamlit):
                     st.error("❌ 분석에 실패했습니다.")
                     logger.error("PDF 분석 실패")
                     # 실패 로깅
-                    analytics.log_activity(
+                    analytics.log_activity_async(
                         st.session_state.analytics_session_id,
                         action_type="pdf_analysis",
                         file_size_bytes=uploaded_file.size,
@@ -261,10 +412,10 @@ def render_pdf_tab(auditor: KOICAAuditorStreamlit):
                     )
 
             except Exception as e:
-                logger.error(f"PDF 분석 오류: {e}", exc_info=True)
+                logger.error("PDF 분석 오류: %s", e, exc_info=True)
                 st.error(f"❌ PDF 분석 중 오류가 발생했습니다.")
                 # 예외 로깅
-                analytics.log_activity(
+                analytics.log_activity_async(
                     st.session_state.analytics_session_id,
                     action_type="pdf_analysis",
                     file_size_bytes=uploaded_file.size,
@@ -274,50 +425,10 @@ def render_pdf_tab(auditor: KOICAAuditorStreamlit):
                 # 프로덕션에서는 상세 에러를 숨김 (로그에만 기록)
 
     # 결과 표시
-    if CacheConfig.SESSION_PDF_RESULTS in st.session_state:
-        results = st.session_state[CacheConfig.SESSION_PDF_RESULTS]
-        display_results(results)
-
-        # 다운로드 버튼 3개 (TXT, JSON, CSV)
-        st.markdown("### 📥 심사 결과 다운로드")
-        col1, col2, col3 = st.columns(3)
-
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-        with col1:
-            report_text = generate_report_text(results)
-            st.download_button(
-                label="📄 텍스트 (TXT)",
-                data=report_text,
-                file_name=f"KOICA_심사결과_{timestamp}.txt",
-                mime="text/plain",
-                key="download_pdf_txt",
-                help="사람이 읽기 쉬운 텍스트 형식"
-            )
-
-        with col2:
-            report_json = generate_report_json(results)
-            st.download_button(
-                label="💾 JSON",
-                data=report_json,
-                file_name=f"KOICA_심사결과_{timestamp}.json",
-                mime="application/json",
-                key="download_pdf_json",
-                help="데이터베이스 저장에 적합한 JSON 형식"
-            )
-
-        with col3:
-            report_csv = generate_report_csv(results)
-            st.download_button(
-                label="📊 CSV",
-                data=report_csv,
-                file_name=f"KOICA_심사결과_{timestamp}.csv",
-                mime="text/csv",
-                key="download_pdf_csv",
-                help="엑셀/스프레드시트에서 열어볼 수 있는 CSV 형식"
-            )
+    render_results(CacheConfig.SESSION_PDF_RESULTS, "pdf")
 
 
+@st.fragment
 def render_text_tab(auditor: KOICAAuditorStreamlit):
     """텍스트 분석 탭 렌더링
 
@@ -337,10 +448,11 @@ def render_text_tab(auditor: KOICAAuditorStreamlit):
             st.warning("⚠️ 분석할 텍스트를 입력하세요")
             return
 
-        logger.info(f"텍스트 분석 시작: {len(text_input)} 문자")
+        logger.info("텍스트 분석 시작: %d 문자", len(text_input))
+        clear_results(CacheConfig.SESSION_TEXT_RESULTS)
 
         # 익명 분석 활동 로깅 (텍스트 내용은 저장하지 않음)
-        analytics.log_activity(
+        analytics.log_activity_async(
             st.session_state.analytics_session_id,
             action_type="text_analysis_started",
             action_detail=f"text_length:{len(text_input)}"
@@ -353,7 +465,7 @@ def render_text_tab(auditor: KOICAAuditorStreamlit):
                 st.session_state[CacheConfig.SESSION_TEXT_RESULTS] = results
                 logger.info("텍스트 분석 완료")
                 # 성공 로깅
-                analytics.log_activity(
+                analytics.log_activity_async(
                     st.session_state.analytics_session_id,
                     action_type="text_analysis",
                     action_detail=f"text_length:{len(text_input)}",
@@ -363,7 +475,7 @@ def render_text_tab(auditor: KOICAAuditorStreamlit):
                 st.error("❌ 분석에 실패했습니다.")
                 logger.error("텍스트 분석 실패")
                 # 실패 로깅
-                analytics.log_activity(
+                analytics.log_activity_async(
                     st.session_state.analytics_session_id,
                     action_type="text_analysis",
                     action_detail=f"text_length:{len(text_input)}",
@@ -372,10 +484,10 @@ def render_text_tab(auditor: KOICAAuditorStreamlit):
                 )
 
         except Exception as e:
-            logger.error(f"텍스트 분석 오류: {e}", exc_info=True)
+            logger.error("텍스트 분석 오류: %s", e, exc_info=True)
             st.error(f"❌ 텍스트 분석 중 오류가 발생했습니다.")
             # 예외 로깅
-            analytics.log_activity(
+            analytics.log_activity_async(
                 st.session_state.analytics_session_id,
                 action_type="text_analysis",
                 action_detail=f"text_length:{len(text_input)}",
@@ -384,47 +496,166 @@ def render_text_tab(auditor: KOICAAuditorStreamlit):
             )
 
     # 결과 표시
-    if CacheConfig.SESSION_TEXT_RESULTS in st.session_state:
-        results = st.session_state[CacheConfig.SESSION_TEXT_RESULTS]
-        display_results(results)
+    render_results(CacheConfig.SESSION_TEXT_RESULTS, "text")
 
-        # 다운로드 버튼 3개 (TXT, JSON, CSV)
-        st.markdown("### 📥 심사 결과 다운로드")
-        col1, col2, col3 = st.columns(3)
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+@st.fragment
+def render_batch_tab(auditor: KOICAAuditorStreamlit, api_key: str):
+    """배치 분석 탭 렌더링 (여러 보고서를 Gemini Batch API로 일괄 심사)
 
-        with col1:
-            report_text = generate_report_text(results)
-            st.download_button(
-                label="📄 텍스트 (TXT)",
-                data=report_text,
-                file_name=f"KOICA_심사결과_{timestamp}.txt",
-                mime="text/plain",
-                key="download_text_txt",
-                help="사람이 읽기 쉬운 텍스트 형식"
-            )
+    Args:
+        auditor: 심사 시스템 인스턴스
+        api_key: Google API 키
+    """
+    st.markdown("### 📦 여러 보고서 일괄 분석")
+    st.info(
+        "💡 배치 분석은 결과가 즉시 나오지 않는 대신(최대 24시간) 비용이 절반입니다. "
+        "제출 후 '결과 확인' 버튼으로 진행 상황을 조회하세요."
+    )
+
+    if not BATCH_API_AVAILABLE:
+        st.warning("⚠️ 배치 분석에는 google-genai 패키지가 필요합니다: `pip install google-genai`")
+        return
+
+    uploaded_files = st.file_uploader(
+        "KOICA 예비조사 보고서 (PDF, 여러 개 선택 가능)",
+        type=FileConfig.SUPPORTED_FILE_TYPES,
+        accept_multiple_files=True,
+        key="batch_uploader"
+    )
+
+    if uploaded_files:
+        if len(uploaded_files) > APIConfig.BATCH_MAX_DOCUMENTS:
+            st.error(f"❌ 한 번에 최대 {APIConfig.BATCH_MAX_DOCUMENTS}개까지 제출할 수 있습니다.")
+            return
+
+        if st.button("📤 배치 제출", type="primary", key="submit_batch"):
+            logger.info("배치 분석 제출 시작: %d개 문서", len(uploaded_files))
+            prompts = {}
+            rag_used = {}
+
+            try:
+                for uploaded_file in uploaded_files:
+                    if not validate_file_size(uploaded_file):
+                        continue
+
+                    # 같은 이름의 파일은 번호를 붙여 요청 키가 겹치지 않도록 함
+                    doc_name = uploaded_file.name
+                    suffix = 2
+                    while doc_name in prompts:
+                        doc_name = f"{uploaded_file.name} ({suffix})"
+                        suffix += 1
+
+                    st.caption(f"📄 {doc_name} 준비 중...")
+                    doc_hash = auditor.hash_pdf_file(uploaded_file)
+                    full_text = auditor.extract_text_from_pdf(uploaded_file, doc_hash=doc_hash)
+                    if not full_text:
+                        st.warning(f"⚠️ {doc_name}: 텍스트를 추출하지 못해 제외합니다.")
+                        continue
+
+                    policy_prompt, impl_prompt, rag_used[doc_name] = auditor.build_analysis_prompts(
+                        full_text, doc_hash=doc_hash
+                    )
+                    prompts[doc_name] = (policy_prompt, impl_prompt)
+
+                if not prompts:
+                    st.error("❌ 제출할 수 있는 문서가 없습니다.")
+                    return
+
+                job_name = BatchAuditClient(api_key, auditor.model_name).submit(prompts)
+                st.session_state[CacheConfig.SESSION_BATCH_JOB] = {
+                    "name": job_name,
+                    "documents": rag_used
+                }
+                st.success(f"✅ {len(prompts)}개 문서 제출 완료 (작업: {job_name})")
+
+                analytics.log_activity_async(
+                    st.session_state.analytics_session_id,
+                    action_type="batch_analysis_submitted",
+                    success=True
+                )
+
+            except Exception as e:
+                logger.error("배치 제출 오류: %s", e, exc_info=True)
+                st.error("❌ 배치 제출 중 오류가 발생했습니다.")
+                analytics.log_activity_async(
+                    st.session_state.analytics_session_id,
+                    action_type="batch_analysis_submitted",
+                    success=False,
+                    error_type=type(e).__name__
+                )
+
+    batch_job = st.session_state.get(CacheConfig.SESSION_BATCH_JOB)
+    if not batch_job:
+        return
+
+    st.markdown(f"**제출된 작업:** `{batch_job['name']}` (문서 {len(batch_job['documents'])}개)")
+
+    if st.button("🔄 결과 확인", key="check_batch"):
+        try:
+            client = BatchAuditClient(api_key)
+            job = client.get_job(batch_job["name"])
+            state = job.state.name
+
+            if state not in TERMINAL_STATES:
+                st.info(f"⏳ 처리 중입니다 ({state}). 잠시 후 다시 확인하세요.")
+            elif state != "JOB_STATE_SUCCEEDED":
+                st.error(f"❌ 배치 작업이 완료되지 못했습니다 ({state}).")
+                logger.error("배치 작업 실패: %s (%s)", batch_job['name'], state)
+            else:
+                responses = client.fetch_results(job)
+                duration = client.job_duration(job)
+                batch_job["results"] = {
+                    doc_name: auditor.build_results(
+                        auditor.parse_analysis_response(
+                            responses.get(doc_name, {}).get(POLICY_KEY),
+                            AuditConfig.POLICY_ALIGNMENT_MAX_SCORE
+                        ),
+                        auditor.parse_analysis_response(
+                            responses.get(doc_name, {}).get(IMPLEMENTATION_KEY),
+                            AuditConfig.IMPLEMENTATION_READINESS_MAX_SCORE
+                        ),
+                        duration,
+                        doc_rag_used
+                    )
+                    for doc_name, doc_rag_used in batch_job["documents"].items()
+                }
+                logger.info("배치 결과 수집 완료: %d개 문서", len(batch_job['results']))
 
-        with col2:
-            report_json = generate_report_json(results)
+        except Exception as e:
+            logger.error("배치 결과 조회 오류: %s", e, exc_info=True)
+            st.error("❌ 배치 결과 조회 중 오류가 발생했습니다.")
+
+    batch_results = batch_job.get("results")
+    if not batch_results:
+        return
+
+    st.markdown("### 📊 배치 분석 결과")
+    st.dataframe(
+        [
+            {
+                "문서": doc_name,
+                "총점": results["총점"],
+                "정책부합성": f"{results['정책부합성']['점수']}/{results['정책부합성']['만점']}",
+                "추진여건": f"{results['추진여건']['점수']}/{results['추진여건']['만점']}"
+            }
+            for doc_name, results in batch_results.items()
+        ],
+        use_container_width=True,
+        hide_index=True
+    )
+
+    # display_results 내부에 expander가 있어 문서별 구분은 테두리 컨테이너로 표시
+    for idx, (doc_name, results) in enumerate(batch_results.items()):
+        with st.container(border=True):
+            st.markdown(f"#### 📄 {doc_name}")
+            display_results(results)
             st.download_button(
                 label="💾 JSON",
-                data=report_json,
-                file_name=f"KOICA_심사결과_{timestamp}.json",
+                data=generate_report_json(results),
+                file_name=f"KOICA_심사결과_{os.path.splitext(doc_name)[0]}.json",
                 mime="application/json",
-                key="download_text_json",
-                help="데이터베이스 저장에 적합한 JSON 형식"
-            )
-
-        with col3:
-            report_csv = generate_report_csv(results)
-            st.download_button(
-                label="📊 CSV",
-                data=report_csv,
-                file_name=f"KOICA_심사결과_{timestamp}.csv",
-                mime="text/csv",
-                key="download_text_csv",
-                help="엑셀/스프레드시트에서 열어볼 수 있는 CSV 형식"
+                key=f"download_batch_json_{idx}"
             )
 
 
@@ -447,7 +678,7 @@ def render_guide_tab():
     st.markdown("#### 🚀 RAG 작동 방식")
     st.markdown("""
     1. **문서 분할**: 전체 PDF를 1,500자 단위 청크로 분할
-    2. **벡터화**: 각 청크를 768차원 벡터로 변환 (단일 텍스트씩 처리)
+    2. **벡터화**: 각 청크를 768차원 벡터로 변환 (최대 100개씩 배치 요청, 실패 시 해당 배치만 개별 재시도)
     3. **검색**: 질문과 관련된 상위 15개 청크 검색
     4. **분석**: 검색된 핵심 내용만으로 AI 분석 수행
     """)
@@ -492,7 +723,7 @@ def main():
     # 익명 세션 ID 초기화 (개인정보 수집 안 함)
     if "analytics_session_id" not in st.session_state:
         st.session_state.analytics_session_id = analytics.get_or_create_session()
-        analytics.log_activity(
+        analytics.log_activity_async(
             st.session_state.analytics_session_id,
             action_type="app_start",
             action_detail="Application started"
@@ -529,21 +760,22 @@ def main():
     logger.info("API 키 로드 완료")
 
     # 사이드바
-    render_sidebar()
+    model_name = render_sidebar()
 
     # 심사 시스템 초기화
     try:
-        auditor = KOICAAuditorStreamlit(api_key=api_key)
+        auditor = get_auditor(api_key, model_name)
         logger.info("심사 시스템 초기화 완료")
     except Exception as e:
         st.error(f"❌ 초기화 실패: 시스템을 시작할 수 없습니다.")
-        logger.error(f"초기화 실패: {e}", exc_info=True)
+        logger.error("초기화 실패: %s", e, exc_info=True)
         st.stop()
 
-    # 메인 탭
-    tab1, tab2, tab3 = st.tabs([
+    # 메인 탭 (분석 탭은 st.fragment라 탭 안의 위젯 조작은 해당 탭만 다시 실행)
+    tab1, tab2, tab3, tab4 = st.tabs([
         "📄 PDF 분석 (권장)",
         "📝 텍스트 분석",
+        "📦 배치 분석",
         "ℹ️ 사용 가이드"
     ])
 
@@ -554,6 +786,9 @@ def main():
         render_text_tab(auditor)
 
     with tab3:
+        render_batch_tab(auditor, api_key)
+
+    with tab4:
         render_guide_tab()
 
     # 푸터
@@ -2,10 +2,11 @@
 KOICA 사업 예비조사 심사 시스템 - UI 모듈
 """
 
-from ui.components import display_results, generate_report_text, get_custom_css
+from ui.components import display_results, generate_reports, generate_report_text, get_custom_css
 
 __all__ = [
     'display_results',
+    'generate_reports',
     'generate_report_text',
     'get_custom_css'
 ]
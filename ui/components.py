@@ -4,7 +4,7 @@ KOICA 사업 예비조사 심사 시스템 - UI 컴포넌트
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import json
 import csv
@@ -135,87 +135,119 @@ def _display_implementation_readiness(impl: Dict[str, Any]) -> None:
             st.markdown(f"- {r}")
 
 
-def generate_report_text(results: Dict[str, Any]) -> str:
+# 보고서에 포함되는 평가 영역 (결과 키)
+_REPORT_SECTIONS: Tuple[str, ...] = ("정책부합성", "추진여건")
+
+# 영역별 목록 항목 (결과 키, JSON/CSV 표시명)
+_REPORT_LISTS: Tuple[Tuple[str, str], ...] = (
+    ("강점", "강점"),
+    ("약점", "약점"),
+    ("제안", "개선제안"),
+)
+
+
+def _bullets(prefix: str, items) -> List[str]:
+    """목록 항목을 들여쓴 글머리표 줄로 변환"""
+    return [f"  {prefix} {item}" for item in items]
+
+
+def _report_section(title: str, section: Dict[str, Any]) -> List[str]:
+    """텍스트 보고서의 평가 영역 한 개 생성
+
+    Args:
+        title: 영역 제목 (예: "[1] 국내외 정책 부합성")
+        section: 영역별 결과 딕셔너리 (점수/만점/세부점수/강점/약점/제안)
+
+    Returns:
+        보고서 줄 리스트
+    """
+    return [
+        f"{title} ({section['점수']}/{section['만점']})",
+        "-" * 80,
+        "\n세부 평가:",
+        *(
+            line
+            for item in section['세부점수']
+            for line in (
+                f"  • {item['item']} ({item['score']}/{item['max_score']})",
+                f"    └ 근거: {item['reason']}"
+            )
+        ),
+        "\n강점:",
+        *_bullets("✓", section['강점']),
+        "\n약점:",
+        *_bullets("✗", section['약점']),
+        "\n개선 제안:",
+        *_bullets("→", section['제안']),
+    ]
+
+
+def generate_reports(results: Dict[str, Any]) -> Dict[str, str]:
+    """다운로드용 보고서 (TXT/JSON/CSV)를 한 번에 생성
+
+    세 형식이 같은 생성 시각을 쓰도록 현재 시각을 한 번만 읽습니다.
+
+    Args:
+        results: 심사 결과 딕셔너리
+
+    Returns:
+        형식("text", "json", "csv")별 보고서 문자열과 파일명용 생성 시각("timestamp")
+    """
+    generated_at = datetime.now()
+    return {
+        "timestamp": generated_at.strftime('%Y%m%d_%H%M%S'),
+        "text": generate_report_text(results, generated_at),
+        "json": generate_report_json(results, generated_at),
+        "csv": generate_report_csv(results, generated_at)
+    }
+
+
+def generate_report_text(results: Dict[str, Any], generated_at: Optional[datetime] = None) -> str:
     """텍스트 보고서 생성
 
     Args:
         results: 심사 결과 딕셔너리
+        generated_at: 보고서 생성 시각 (없으면 현재 시각)
 
     Returns:
         텍스트 형식의 보고서
     """
-    lines = []
-    lines.append("=" * 80)
-    lines.append("KOICA 사업 심사 분석 결과 (AI-RAG v3)")
-    lines.append("=" * 80)
-    lines.append(f"분석 일시: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')}")
-    lines.append(f"분석 시간: {results['분석시간']}")
-    lines.append(f"RAG 사용: {'예' if results.get('RAG_사용', False) else '아니오'}")
-    lines.append(f"총점: {results['총점']} / 100\n")
-
-    # 정책 부합성
-    policy = results['정책부합성']
-    lines.append(f"\n[1] 국내외 정책 부합성 ({policy['점수']}/{policy['만점']})")
-    lines.append("-" * 80)
-    lines.append("\n세부 평가:")
-    for item in policy['세부점수']:
-        lines.append(f"  • {item['item']} ({item['score']}/{item['max_score']})")
-        lines.append(f"    └ 근거: {item['reason']}")
-
-    lines.append("\n강점:")
-    for s in policy['강점']:
-        lines.append(f"  ✓ {s}")
-
-    lines.append("\n약점:")
-    for w in policy['약점']:
-        lines.append(f"  ✗ {w}")
-
-    lines.append("\n개선 제안:")
-    for r in policy['제안']:
-        lines.append(f"  → {r}")
-
-    # 추진 여건
-    impl = results['추진여건']
-    lines.append(f"\n\n[2] 사업 추진 여건 ({impl['점수']}/{impl['만점']})")
-    lines.append("-" * 80)
-    lines.append("\n세부 평가:")
-    for item in impl['세부점수']:
-        lines.append(f"  • {item['item']} ({item['score']}/{item['max_score']})")
-        lines.append(f"    └ 근거: {item['reason']}")
-
-    lines.append("\n강점:")
-    for s in impl['강점']:
-        lines.append(f"  ✓ {s}")
-
-    lines.append("\n약점:")
-    for w in impl['약점']:
-        lines.append(f"  ✗ {w}")
-
-    lines.append("\n개선 제안:")
-    for r in impl['제안']:
-        lines.append(f"  → {r}")
-
-    lines.append("\n\n" + "=" * 80)
-    lines.append("면책 조항")
-    lines.append("=" * 80)
-    lines.append("본 분석 결과는 AI 기반 참고용이며, KOICA 공식 심사 결과가 아닙니다.")
-    lines.append("실제 심사는 전문가의 종합적 판단으로 이루어집니다.")
+    generated_at = generated_at or datetime.now()
+    rule = "=" * 80
+    lines = [
+        rule,
+        "KOICA 사업 심사 분석 결과 (AI-RAG v3)",
+        rule,
+        f"분석 일시: {generated_at.strftime('%Y년 %m월 %d일 %H:%M:%S')}",
+        f"분석 시간: {results['분석시간']}",
+        f"RAG 사용: {'예' if results.get('RAG_사용', False) else '아니오'}",
+        f"총점: {results['총점']} / 100\n",
+        *_report_section("\n[1] 국내외 정책 부합성", results['정책부합성']),
+        *_report_section("\n\n[2] 사업 추진 여건", results['추진여건']),
+        f"\n\n{rule}",
+        "면책 조항",
+        rule,
+        "본 분석 결과는 AI 기반 참고용이며, KOICA 공식 심사 결과가 아닙니다.",
+        "실제 심사는 전문가의 종합적 판단으로 이루어집니다.",
+    ]
 
     return "\n".join(lines)
 
 
-def generate_report_json(results: Dict[str, Any]) -> str:
+def generate_report_json(results: Dict[str, Any], generated_at: Optional[datetime] = None) -> str:
     """JSON 보고서 생성
 
     Args:
         results: 심사 결과 딕셔너리
+        generated_at: 보고서 생성 시각 (없으면 현재 시각)
 
     Returns:
         JSON 형식의 보고서
     """
+    generated_at = generated_at or datetime.now()
     report_data = {
         "메타데이터": {
-            "분석_일시": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "분석_일시": generated_at.strftime('%Y-%m-%d %H:%M:%S'),
             "분석_시간": results['분석시간'],
             "RAG_사용": results.get('RAG_사용', False),
             "버전": "v3.1"
@@ -230,38 +262,35 @@ def generate_report_json(results: Dict[str, Any]) -> str:
             "추진여건_만점": results['추진여건']['만점'],
             "추진여건_백분율": round(results['추진여건']['백분율'], 2)
         },
-        "정책부합성": {
-            "세부점수": results['정책부합성']['세부점수'],
-            "강점": results['정책부합성']['강점'],
-            "약점": results['정책부합성']['약점'],
-            "개선제안": results['정책부합성']['제안']
-        },
-        "추진여건": {
-            "세부점수": results['추진여건']['세부점수'],
-            "강점": results['추진여건']['강점'],
-            "약점": results['추진여건']['약점'],
-            "개선제안": results['추진여건']['제안']
+        **{
+            key: {
+                "세부점수": results[key]['세부점수'],
+                **{label: results[key][field] for field, label in _REPORT_LISTS}
+            }
+            for key in _REPORT_SECTIONS
         }
     }
 
     return json.dumps(report_data, ensure_ascii=False, indent=2)
 
 
-def generate_report_csv(results: Dict[str, Any]) -> str:
+def generate_report_csv(results: Dict[str, Any], generated_at: Optional[datetime] = None) -> str:
     """CSV 보고서 생성
 
     Args:
         results: 심사 결과 딕셔너리
+        generated_at: 보고서 생성 시각 (없으면 현재 시각)
 
     Returns:
         CSV 형식의 보고서
     """
+    generated_at = generated_at or datetime.now()
     output = io.StringIO()
     writer = csv.writer(output)
 
     # 메타데이터
     writer.writerow(["메타데이터"])
-    writer.writerow(["분석_일시", datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
+    writer.writerow(["분석_일시", generated_at.strftime('%Y-%m-%d %H:%M:%S')])
     writer.writerow(["분석_시간", results['분석시간']])
     writer.writerow(["RAG_사용", "예" if results.get('RAG_사용', False) else "아니오"])
     writer.writerow(["버전", "v3.1"])
@@ -276,74 +305,25 @@ def generate_report_csv(results: Dict[str, Any]) -> str:
         100,
         f"{(results['총점']/100)*100:.1f}%"
     ])
-    writer.writerow([
-        "정책부합성",
-        results['정책부합성']['점수'],
-        results['정책부합성']['만점'],
-        f"{results['정책부합성']['백분율']:.1f}%"
-    ])
-    writer.writerow([
-        "추진여건",
-        results['추진여건']['점수'],
-        results['추진여건']['만점'],
-        f"{results['추진여건']['백분율']:.1f}%"
-    ])
-    writer.writerow([])
-
-    # 정책부합성 세부점수
-    writer.writerow(["정책부합성 세부평가"])
-    writer.writerow(["항목", "점수", "만점", "근거"])
-    for item in results['정책부합성']['세부점수']:
-        writer.writerow([
-            item['item'],
-            item['score'],
-            item['max_score'],
-            item['reason']
-        ])
-    writer.writerow([])
-
-    # 정책부합성 강점/약점/제안
-    writer.writerow(["정책부합성 강점"])
-    for s in results['정책부합성']['강점']:
-        writer.writerow([s])
-    writer.writerow([])
-
-    writer.writerow(["정책부합성 약점"])
-    for w in results['정책부합성']['약점']:
-        writer.writerow([w])
-    writer.writerow([])
-
-    writer.writerow(["정책부합성 개선제안"])
-    for r in results['정책부합성']['제안']:
-        writer.writerow([r])
-    writer.writerow([])
-
-    # 추진여건 세부점수
-    writer.writerow(["추진여건 세부평가"])
-    writer.writerow(["항목", "점수", "만점", "근거"])
-    for item in results['추진여건']['세부점수']:
-        writer.writerow([
-            item['item'],
-            item['score'],
-            item['max_score'],
-            item['reason']
-        ])
-    writer.writerow([])
-
-    # 추진여건 강점/약점/제안
-    writer.writerow(["추진여건 강점"])
-    for s in results['추진여건']['강점']:
-        writer.writerow([s])
-    writer.writerow([])
-
-    writer.writerow(["추진여건 약점"])
-    for w in results['추진여건']['약점']:
-        writer.writerow([w])
-    writer.writerow([])
+    writer.writerows(
+        [key, results[key]['점수'], results[key]['만점'], f"{results[key]['백분율']:.1f}%"]
+        for key in _REPORT_SECTIONS
+    )
 
-    writer.writerow(["추진여건 개선제안"])
-    for r in results['추진여건']['제안']:
-        writer.writerow([r])
+    # 영역별 세부점수와 강점/약점/제안 (블록 사이에 빈 줄)
+    for key in _REPORT_SECTIONS:
+        writer.writerow([])
+        writer.writerow([f"{key} 세부평가"])
+        writer.writerow(["항목", "점수", "만점", "근거"])
+        writer.writerows(
+            [item['item'], item['score'], item['max_score'], item['reason']]
+            for item in results[key]['세부점수']
+        )
+
+        for field, label in _REPORT_LISTS:
+            writer.writerow([])
+            writer.writerow([f"{key} {label}"])
+            writer.writerows([entry] for entry in results[key][field])
 
     # UTF-8 BOM 추가 (macOS 엑셀 한글 깨짐 방지)
     return '\ufeff' + output.getvalue()
@@ -9,12 +9,22 @@ KOICA 사업 예비조사 심사 시스템 - 익명 사용자 분석
 
 import os
 import uuid
+import zlib
+import queue
+import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
+from urllib.parse import urlparse
 import logging
 
-from config import LogConfig
+try:
+    import psycopg2
+except ImportError:  # PostgreSQL(배포 환경)에서만 필요
+    psycopg2 = None
+
+from config import AnalyticsConfig, LogConfig
 from utils.logger import setup_logger
 
 logger = setup_logger(name="koica_analytics", log_to_file=True)
@@ -39,8 +49,8 @@ class AnonymousAnalytics:
 
         if self.use_postgres:
             # PostgreSQL 사용 (Streamlit Cloud 배포)
-            import psycopg2
-            from urllib.parse import urlparse
+            if psycopg2 is None:
+                raise ImportError("DATABASE_URL 사용 시 psycopg2 패키지가 필요합니다")
 
             self.db_type = "postgresql"
             logger.info("PostgreSQL 모드로 실행 중 (배포 환경)")
@@ -56,22 +66,25 @@ class AnonymousAnalytics:
             }
         else:
             # SQLite 사용 (로컬 개발)
-            import sqlite3
-
             self.db_type = "sqlite"
             self.db_path = Path(db_path)
             self.db_path.parent.mkdir(exist_ok=True)
             logger.info(f"SQLite 모드로 실행 중 (로컬 개발): {self.db_path}")
 
+        self.sample_rate = self._load_sample_rate()
+
+        # 비동기 활동 기록용 대기열 (첫 사용 시 작업 스레드 시작)
+        self._log_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=AnalyticsConfig.LOG_QUEUE_MAX_SIZE)
+        self._log_worker: Optional[threading.Thread] = None
+        self._log_worker_lock = threading.Lock()
+
         self._init_database()
 
     def _get_connection(self):
         """데이터베이스 연결 가져오기"""
         if self.use_postgres:
-            import psycopg2
             return psycopg2.connect(**self.db_config)
         else:
-            import sqlite3
             return sqlite3.connect(self.db_path)
 
     def _init_database(self):
@@ -160,6 +173,38 @@ class AnonymousAnalytics:
         except Exception as e:
             logger.error(f"데이터베이스 초기화 실패: {e}", exc_info=True)
 
+    @staticmethod
+    def _load_sample_rate() -> float:
+        """환경변수 또는 기본 설정에서 세션 표본 비율 조회 (0-1로 제한)"""
+        value = os.getenv(AnalyticsConfig.SAMPLE_RATE_ENV)
+        if value is None:
+            return AnalyticsConfig.SAMPLE_RATE
+
+        try:
+            rate = float(value)
+        except ValueError:
+            logger.warning(f"잘못된 {AnalyticsConfig.SAMPLE_RATE_ENV} 값, 기본값 사용: {value}")
+            return AnalyticsConfig.SAMPLE_RATE
+
+        rate = min(max(rate, 0.0), 1.0)
+        logger.info(f"활동 기록 표본 비율: {rate:.0%}")
+        return rate
+
+    def is_sampled(self, session_id: str) -> bool:
+        """세션이 기록 대상 표본에 포함되는지 여부
+
+        세션 ID의 CRC32로 판정하므로 프로세스가 달라도 같은 세션은 항상 같은 결과입니다.
+
+        Args:
+            session_id: 익명 세션 ID
+
+        Returns:
+            기록 대상 여부
+        """
+        if self.sample_rate >= 1.0:
+            return True
+        return zlib.crc32(session_id.encode('utf-8')) % 10000 < self.sample_rate * 10000
+
     def get_or_create_session(self, session_id: Optional[str] = None) -> str:
         """
         세션 ID 가져오기 또는 생성
@@ -173,6 +218,10 @@ class AnonymousAnalytics:
         if not session_id:
             session_id = str(uuid.uuid4())
 
+        # 표본에서 빠진 세션은 ID만 발급하고 DB에는 기록하지 않음
+        if not self.is_sampled(session_id):
+            return session_id
+
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
@@ -256,6 +305,48 @@ class AnonymousAnalytics:
         except Exception as e:
             logger.error(f"활동 로그 기록 실패: {e}", exc_info=True)
 
+    def log_activity_async(self, session_id: str, action_type: str, **kwargs) -> None:
+        """사용자 활동을 백그라운드 스레드에서 기록 (호출 스레드는 DB I/O를 기다리지 않음)
+
+        인자는 `log_activity`와 같습니다. 대기열이 가득 차면 해당 기록은 버리고,
+        표본에서 빠진 세션(`is_sampled`)의 기록은 대기열에 넣지 않습니다.
+
+        Args:
+            session_id: 익명 세션 ID
+            action_type: 활동 유형
+            **kwargs: action_detail, file_size_bytes, success, error_type
+        """
+        if not self.is_sampled(session_id):
+            return
+
+        self._ensure_log_worker()
+        try:
+            self._log_queue.put_nowait({"session_id": session_id, "action_type": action_type, **kwargs})
+        except queue.Full:
+            logger.warning(f"활동 로그 대기열이 가득 차 기록 생략: {action_type}")
+
+    def _ensure_log_worker(self) -> None:
+        """활동 기록 작업 스레드 시작 (프로세스당 한 번)"""
+        if self._log_worker is not None:
+            return
+        with self._log_worker_lock:
+            if self._log_worker is None:
+                self._log_worker = threading.Thread(
+                    target=self._drain_log_queue,
+                    name="analytics-log-writer",
+                    daemon=True
+                )
+                self._log_worker.start()
+
+    def _drain_log_queue(self) -> None:
+        """대기열의 활동 기록을 순서대로 DB에 기록 (작업 스레드)"""
+        while True:
+            entry = self._log_queue.get()
+            try:
+                self.log_activity(**entry)
+            finally:
+                self._log_queue.task_done()
+
     def update_daily_stats(self):
         """일일 통계 업데이트"""
         try:
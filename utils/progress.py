@@ -0,0 +1,53 @@
+"""
+KOICA 사업 예비조사 심사 시스템 - 진행률 표시 유틸리티
+Streamlit 진행 바 업데이트 횟수 제한
+"""
+
+import streamlit as st
+
+from config import UIConfig
+
+
+class ThrottledProgress:
+    """일정 비율 이상 진행됐을 때만 갱신하는 Streamlit 진행 바
+
+    `progress()` 호출마다 브라우저로 메시지가 전송되므로,
+    페이지/청크 단위 루프에서는 갱신 횟수를 제한합니다.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        text: str = "",
+        min_step: float = UIConfig.PROGRESS_UPDATE_STEP
+    ):
+        """
+        Args:
+            total: 전체 작업 수
+            text: 초기 표시 문구
+            min_step: 갱신 간 최소 진행 비율 (0-1)
+        """
+        self.total = max(total, 1)
+        self.min_step = min_step
+        self._last = 0.0
+        self._bar = st.progress(0, text=text or None)
+
+    def update(self, current: int, text: str = "") -> None:
+        """진행 상황 갱신 (변화가 작으면 생략)
+
+        Args:
+            current: 완료된 작업 수
+            text: 표시 문구
+        """
+        value = min(current / self.total, 1.0)
+        if value < 1.0 and value - self._last < self.min_step:
+            return
+        if value == self._last:
+            return
+
+        self._last = value
+        self._bar.progress(value, text=text or None)
+
+    def empty(self) -> None:
+        """진행 바 제거"""
+        self._bar.empty()
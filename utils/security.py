@@ -0,0 +1,68 @@
+"""
+KOICA 사업 예비조사 심사 시스템 - 보안 유틸리티
+관리자 비밀번호 해시 생성 및 검증
+"""
+
+import hashlib
+import hmac
+import secrets
+
+# scrypt 파라미터 (N=2^14, r=8, p=1 → 약 16MB 메모리 사용)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_SALT_BYTES = 16
+SCRYPT_KEY_BYTES = 32
+SCRYPT_PREFIX = "scrypt"
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    """scrypt 키 유도"""
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=128 * n * r * 2,
+        dklen=SCRYPT_KEY_BYTES
+    )
+
+
+def hash_password(password: str) -> str:
+    """비밀번호 해시 생성 (scrypt)
+
+    Args:
+        password: 원본 비밀번호
+
+    Returns:
+        `scrypt$N$r$p$salt$hash` 형식의 해시 문자열
+    """
+    salt = secrets.token_bytes(SCRYPT_SALT_BYTES)
+    key = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    return f"{SCRYPT_PREFIX}${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${key.hex()}"
+
+
+def verify_password(password: str, stored_hash: str) -> bool:
+    """비밀번호 검증
+
+    scrypt 형식 해시와 이전 버전의 SHA-256 해시(64자리 hex)를 모두 지원합니다.
+    비교는 타이밍 공격을 막기 위해 상수 시간(hmac.compare_digest)으로 수행합니다.
+
+    Args:
+        password: 입력된 비밀번호
+        stored_hash: 저장된 해시 문자열
+
+    Returns:
+        일치 여부
+    """
+    if stored_hash.startswith(f"{SCRYPT_PREFIX}$"):
+        try:
+            _, n, r, p, salt_hex, key_hex = stored_hash.split("$")
+            key = _scrypt(password, bytes.fromhex(salt_hex), int(n), int(r), int(p))
+        except ValueError:
+            return False
+        return hmac.compare_digest(key.hex(), key_hex)
+
+    # 이전 버전 호환 (SHA-256)
+    return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), stored_hash)